@@ -16,6 +16,7 @@ TestRail 轉換器主程式
 
 import sys
 import argparse
+import functools
 import logging
 from typing import Optional, Tuple
 from pathlib import Path
@@ -254,15 +255,15 @@ def handle_test_connection() -> bool:
         return False
 
 
-def parse_command_line_args(args: Optional[list] = None) -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    解析命令列參數
+    建立命令列參數解析器
+    
+    解析器本身不保存解析狀態，建立一次後即可重複使用
     
-    Args:
-        args: 命令列參數列表（用於測試）
-        
     Returns:
-        解析後的參數物件
+        設定好所有參數的 ArgumentParser
     """
     parser = argparse.ArgumentParser(
         description="TestRail 轉換器 - 將 TestRail XML 檔案轉換為 Lark 表格",
@@ -314,7 +315,20 @@ def parse_command_line_args(args: Optional[list] = None) -> argparse.Namespace:
         help="執行模式 (預設: interactive)"
     )
     
-    parsed_args = parser.parse_args(args)
+    return parser
+
+
+def parse_command_line_args(args: Optional[list] = None) -> argparse.Namespace:
+    """
+    解析命令列參數
+    
+    Args:
+        args: 命令列參數列表（用於測試）
+        
+    Returns:
+        解析後的參數物件
+    """
+    parsed_args = _build_parser().parse_args(args)
     
     # 根據參數自動判斷模式
     if parsed_args.xml_file and parsed_args.wiki_token and parsed_args.table_id:
@@ -5,9 +5,22 @@ TestRail XML 解析器模組
 """
 
 import logging
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, BinaryIO, Iterator, Optional, Union
+
+try:
+    import _elementtree
+except ImportError:  # 非 CPython 或未編譯 C 加速模組的環境
+    _elementtree = None
+
+# ElementTree 匯入時會自動改用 C 加速模組，這裡記錄實際使用的後端供統計資訊顯示
+_XML_BACKEND = (
+    "_elementtree"
+    if _elementtree is not None and ET.XMLParser is _elementtree.XMLParser
+    else "xml.etree.ElementTree"
+)
 
 
 class TestRailParseError(Exception):
@@ -55,33 +68,76 @@ class TestRailXMLParser:
             self.logger.warning(error_msg)
         
         self.logger.info(f"開始解析 XML 檔案: {file_path}")
+        return self._parse_source(file_path, file_path)
+    
+    def parse_xml_stream(self, xml_stream: BinaryIO) -> List[Dict[str, Any]]:
+        """
+        解析已開啟的 TestRail XML 位元組串流並提取測試案例資料
         
-        try:
-            # 解析 XML 檔案
-            tree = ET.parse(file_path)
-            xml_root = tree.getroot()
+        與 parse_xml_file 共用相同的解析與驗證流程，適用於資料已在記憶體中的情況
+        
+        Args:
+            xml_stream: 以二進位模式讀取的檔案物件（如 io.BytesIO）
             
-            # 驗證 XML 結構
-            if not self.validate_xml_structure(xml_root):
-                error_msg = f"XML 檔案結構不符合 TestRail 格式: {file_path}"
-                self.logger.error(error_msg)
-                raise ValueError(error_msg)
+        Returns:
+            測試案例資料列表，每個字典包含原始 XML 資料
             
-            # 提取測試案例
-            test_cases = self.extract_test_cases(xml_root)
+        Raises:
+            ET.ParseError: XML 格式錯誤
+            ValueError: 內容格式不符
+        """
+        source_name = getattr(xml_stream, "name", "<stream>")
+        self.logger.info(f"開始解析 XML 串流: {source_name}")
+        return self._parse_source(xml_stream, source_name)
+    
+    def _parse_source(self, source: Union[str, BinaryIO], source_name: str) -> List[Dict[str, Any]]:
+        """
+        解析 XML 來源並提取測試案例資料
+        
+        Args:
+            source: 檔案路徑或二進位檔案物件
+            source_name: 用於日誌與錯誤訊息的來源名稱
             
-            self.logger.info(f"成功解析 XML 檔案，提取到 {len(test_cases)} 個測試案例")
-            return test_cases
+        Returns:
+            測試案例資料列表
+        """
+        try:
+            # 以 iterparse 串流解析：每個 case 元素結束時立即提取並清空內容，
+            # 不必等整棵樹建立完成再走訪一次，已處理案例的子元素也不會留在記憶體。
+            # case 延後到下一個結束事件才提取：最後一個結束事件必為根元素，
+            # 根元素本身是 case 時不屬於 TestRail 結構，不予提取。
+            # 巢狀 case 以結束順序輸出，內層案例排在外層之前。
+            test_cases = []
+            pending_case = None
+            events = ET.iterparse(source)
+            for _, elem in events:
+                if pending_case is not None:
+                    self._append_test_case(test_cases, pending_case)
+                    pending_case.clear()
+                    pending_case = None
+                if elem.tag == "case":
+                    pending_case = elem
+            xml_root = events.root
             
         except ET.ParseError as e:
-            error_msg = f"XML 檔案格式錯誤: {file_path}, 錯誤: {str(e)}"
+            error_msg = f"XML 檔案格式錯誤: {source_name}, 錯誤: {str(e)}"
             self.logger.error(error_msg)
             raise ET.ParseError(error_msg)
         
         except Exception as e:
-            error_msg = f"解析 XML 檔案時發生未預期錯誤: {file_path}, 錯誤: {str(e)}"
+            error_msg = f"解析 XML 檔案時發生未預期錯誤: {source_name}, 錯誤: {str(e)}"
             self.logger.error(error_msg)
             raise TestRailParseError(error_msg)
+        
+        # 已提取到測試案例即代表結構有效，只有沒有任何案例時才需要另外驗證結構
+        # （清空後的 case 元素仍保留標籤，可照常判斷）
+        if not test_cases and not self.validate_xml_structure(xml_root):
+            error_msg = f"XML 檔案結構不符合 TestRail 格式: {source_name}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        self.logger.info(f"成功解析 XML 檔案，提取到 {len(test_cases)} 個測試案例")
+        return test_cases
     
     def extract_test_cases(self, xml_root: ET.Element) -> List[Dict[str, Any]]:
         """
@@ -105,18 +161,28 @@ class TestRailXMLParser:
         self.logger.debug(f"找到 {len(case_elements)} 個測試案例元素")
         
         for case_elem in case_elements:
-            try:
-                test_case = self._extract_single_test_case(case_elem)
-                if test_case:  # 只添加有效的測試案例
-                    test_cases.append(test_case)
-            except Exception as e:
-                case_id = self._get_element_text(case_elem, "id", "未知")
-                self.logger.warning(f"提取測試案例失敗 (ID: {case_id}): {str(e)}")
-                # 繼續處理其他案例，不中斷整個流程
+            self._append_test_case(test_cases, case_elem)
         
         self.logger.info(f"成功提取 {len(test_cases)} 個有效測試案例")
         return test_cases
     
+    def _append_test_case(self, test_cases: List[Dict[str, Any]], case_elem: ET.Element) -> None:
+        """
+        提取單個 case 元素並在有效時加入測試案例列表
+        
+        Args:
+            test_cases: 收集結果的測試案例列表
+            case_elem: case XML 元素
+        """
+        try:
+            test_case = self._extract_single_test_case(case_elem)
+            if test_case:  # 只添加有效的測試案例
+                test_cases.append(test_case)
+        except Exception as e:
+            case_id = self._get_element_text(case_elem, "id", "未知")
+            self.logger.warning(f"提取測試案例失敗 (ID: {case_id}): {str(e)}")
+            # 繼續處理其他案例，不中斷整個流程
+    
     def validate_xml_structure(self, xml_root: ET.Element) -> bool:
         """
         驗證 XML 結構是否符合 TestRail 標準格式
@@ -136,12 +202,13 @@ class TestRailXMLParser:
             self.logger.warning(f"XML 根元素不是 'suite'，而是 '{xml_root.tag}'")
             # 不一定要求嚴格的 suite 根元素，可能有其他格式
         
+        # 直接子元素的標籤索引只建立一次，sections 與直接 case 的判斷都查詢同一份索引
+        root_children = self._index_children(xml_root)
+        
         # 檢查是否包含 sections 元素
-        sections = xml_root.find("sections")
-        if sections is None:
-            # 嘗試直接在根元素下尋找 case 元素
-            cases = xml_root.findall(".//case")
-            if not cases:
+        if "sections" not in root_children:
+            # 嘗試直接在根元素下尋找 case 元素，沒有時才往更深層搜尋
+            if "case" not in root_children and next(self._iter_case_elements(xml_root), None) is None:
                 self.logger.error("XML 中找不到任何測試案例")
                 return False
             else:
@@ -160,8 +227,23 @@ class TestRailXMLParser:
         Returns:
             所有找到的 case 元素列表
         """
-        # 使用 XPath 表達式搜尋所有深度的 case 元素
-        return xml_root.findall(".//case")
+        return list(self._iter_case_elements(xml_root))
+    
+    @staticmethod
+    def _iter_case_elements(xml_root: ET.Element) -> Iterator[ET.Element]:
+        """
+        依文件順序逐一產生 case 元素
+        
+        Args:
+            xml_root: 搜尋的根元素
+            
+        Returns:
+            case 元素的迭代器，只需確認是否存在時可在找到第一個後停止
+        """
+        # 以 iter 直接走訪各子元素的後代，結果與 XPath ".//case" 相同（不含根元素本身），
+        # 但省去 ElementPath 的路徑解析與逐層選擇器
+        for child in xml_root:
+            yield from child.iter("case")
     
     def _extract_single_test_case(self, case_elem: ET.Element) -> Optional[Dict[str, Any]]:
         """
@@ -177,28 +259,28 @@ class TestRailXMLParser:
             return None
         
         try:
-            # 提取基本資訊
+            # 單次走訪子元素建立「標籤 -> 第一個同名元素」對照，
+            # 取代每個欄位各自 find() 一次的重複掃描
+            children = self._index_children(case_elem)
+            
+            # custom 欄位同樣只索引一次；缺少 custom 元素時以空索引取得預設值
+            custom_elem = children.get("custom")
+            custom_children = (
+                self._index_children(custom_elem) if custom_elem is not None else {}
+            )
+            
+            # 以單一字典常值一次建立所有欄位
             test_case = {
-                "id": self._get_element_text(case_elem, "id", ""),
-                "title": self._get_element_text(case_elem, "title", ""),
-                "priority": self._get_element_text(case_elem, "priority", "Medium")
+                "id": self._element_text(children.get("id"), ""),
+                "title": self._element_text(children.get("title"), ""),
+                # 優先級只有少數幾種值，駐留字串讓大量案例共用同一物件
+                "priority": sys.intern(self._element_text(children.get("priority"), "Medium")),
+                "preconds": self._element_text(custom_children.get("preconds"), ""),
+                "steps": self._element_text(custom_children.get("steps"), ""),
+                "expected": self._element_text(custom_children.get("expected"), "")
             }
             
-            # 提取 custom 欄位中的詳細資訊
-            custom_elem = case_elem.find("custom")
-            if custom_elem is not None:
-                test_case.update({
-                    "preconds": self._get_element_text(custom_elem, "preconds", ""),
-                    "steps": self._get_element_text(custom_elem, "steps", ""),
-                    "expected": self._get_element_text(custom_elem, "expected", "")
-                })
-            else:
-                # 如果沒有 custom 元素，設定預設值
-                test_case.update({
-                    "preconds": "",
-                    "steps": "",
-                    "expected": ""
-                })
+            if custom_elem is None:
                 self.logger.debug(f"測試案例 {test_case['id']} 缺少 custom 元素")
             
             # 驗證基本必要欄位
@@ -213,6 +295,38 @@ class TestRailXMLParser:
             self.logger.error(f"提取單個測試案例時發生錯誤: {str(e)}")
             return None
     
+    @staticmethod
+    def _index_children(parent: ET.Element) -> Dict[str, ET.Element]:
+        """
+        建立直接子元素的標籤索引
+        
+        Args:
+            parent: 父元素
+            
+        Returns:
+            標籤對應第一個同名子元素的字典（與 find() 取第一個相符元素的行為一致）
+        """
+        children = {}
+        for child in parent:
+            children.setdefault(child.tag, child)
+        return children
+    
+    @staticmethod
+    def _element_text(element: Optional[ET.Element], default: str = "") -> str:
+        """
+        取得元素去除前後空白的文字內容
+        
+        Args:
+            element: XML 元素，可為 None
+            default: 元素不存在或沒有文字時的預設值
+            
+        Returns:
+            元素的文字內容或預設值
+        """
+        if element is not None and element.text is not None:
+            return element.text.strip()
+        return default
+    
     def _get_element_text(self, parent: ET.Element, tag_name: str, default: str = "") -> str:
         """
         安全地取得 XML 元素的文字內容
@@ -228,12 +342,7 @@ class TestRailXMLParser:
         if parent is None:
             return default
         
-        element = parent.find(tag_name)
-        if element is not None and element.text is not None:
-            # 清理文字內容（移除前後空白）
-            return element.text.strip()
-        
-        return default
+        return self._element_text(parent.find(tag_name), default)
     
     def get_parser_stats(self) -> Dict[str, Any]:
         """
@@ -244,6 +353,9 @@ class TestRailXMLParser:
         """
         return {
             "parser_type": "TestRailXMLParser",
+            "xml_backend": _XML_BACKEND,
+            # TreeBuilder 會把 expat 分段送出的字元資料合併成每個元素一個字串，並保留原有空白
+            "text_buffering": True,
             "supported_formats": ["XML"],
             "supported_encodings": ["UTF-8", "UTF-8-SIG"],
             "features": [
@@ -10,13 +10,147 @@
 - Logger 實例管理
 """
 
+import io
 import os
+import re
+import atexit
+import queue
+import functools
+import operator
 import logging
 import logging.handlers
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """使用大型寫入緩衝的檔案處理器，不在每筆記錄後 flush"""
+    
+    # 檔案寫入緩衝大小（位元組）
+    BUFFER_SIZE = 64 * 1024
+    
+    def _buffer_size(self) -> int:
+        """將緩衝大小對齊檔案系統區塊大小，使每次寫出都是完整區塊"""
+        try:
+            block_size = os.stat(os.path.dirname(self.baseFilename)).st_blksize
+        except (OSError, AttributeError):
+            block_size = io.DEFAULT_BUFFER_SIZE
+        return max(block_size, self.BUFFER_SIZE // block_size * block_size)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self._buffer_size(),
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record: logging.LogRecord):
+        """寫入記錄但不 flush，由背景執行緒在佇列清空時或 ERROR 以上級別時寫出"""
+        try:
+            # 檔案在背景執行緒上延遲開啟，開啟失敗同樣交由 handleError 處理
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                self._write(self.format(record) + self.terminator)
+                if record.levelno >= logging.ERROR:
+                    self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _write(self, text: str):
+        self.stream.write(text)
+
+
+class RawUtf8FileHandler(BufferedFileHandler):
+    """以二進位模式開啟檔案並直接寫入編碼後位元組，略過 TextIOWrapper 的編碼層"""
+    
+    def _open(self):
+        mode = self.mode if 'b' in self.mode else self.mode + 'b'
+        return open(self.baseFilename, mode, buffering=self._buffer_size())
+    
+    def _write(self, text: str):
+        errors = getattr(self, 'errors', None) or 'strict'
+        self.stream.write(text.encode(self.encoding or 'utf-8', errors))
+
+
+class _FileQueueListener(logging.handlers.QueueListener):
+    """單一檔案處理器的背景寫入執行緒，佇列清空時寫出檔案緩衝"""
+    
+    def handle(self, record: logging.LogRecord):
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if not self.respect_handler_level or record.levelno >= handler.level:
+                # 處理器拋出的例外不可中止背景執行緒，否則之後的記錄都會被丟棄
+                try:
+                    handler.handle(record)
+                except RecursionError:
+                    raise
+                except Exception:
+                    handler.handleError(record)
+        
+        # 佇列清空即寫出：負載高時累積的記錄合併寫入，閒置時記錄立即落地
+        if self.queue.empty():
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except RecursionError:
+                    raise
+                except Exception:
+                    pass
+    
+    def is_alive(self) -> bool:
+        """背景執行緒是否仍在執行"""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+
+class FastFormatter(logging.Formatter):
+    """
+    預先解析格式字串的 Formatter
+    
+    格式字串僅含 %(name)s 欄位時，將其轉為位置參數樣板並以 attrgetter 取值，
+    省去每筆記錄以欄位名稱查詢 record.__dict__ 的成本；含其他格式指定（如
+    %(lineno)d、%(levelname)-8s）時沿用標準格式化流程。
+    """
+    
+    _FIELD_PATTERN = re.compile(r'%\((\w+)\)s')
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        
+        self._skeleton: Optional[str] = None
+        self._getters: tuple = ()
+        
+        remainder = self._FIELD_PATTERN.sub('', self._fmt).replace('%%', '')
+        if '%' not in remainder:
+            names = self._FIELD_PATTERN.findall(self._fmt)
+            self._skeleton = self._FIELD_PATTERN.sub('%s', self._fmt)
+            self._getters = tuple(operator.attrgetter(name) for name in names)
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._skeleton is None:
+            return super().formatMessage(record)
+        try:
+            return self._skeleton % tuple(getter(record) for getter in self._getters)
+        except AttributeError:
+            return super().formatMessage(record)
+
+
+# Formatter 以 (fmt, datefmt) 共用，避免每個 Logger 重複建立相同的 Formatter
+_FORMATTER_CACHE: Dict[tuple, logging.Formatter] = {}
+
+
+def _get_formatter(fmt: Optional[str], datefmt: Optional[str] = None) -> logging.Formatter:
+    """取得共用的 Formatter 實例"""
+    key = (fmt, datefmt)
+    formatter = _FORMATTER_CACHE.get(key)
+    if formatter is None:
+        formatter = FastFormatter(fmt, datefmt)
+        _FORMATTER_CACHE[key] = formatter
+    return formatter
+
+
 class LoggerManager:
     """日誌管理器，統一管理所有 Logger 實例"""
     
@@ -25,6 +159,17 @@ class LoggerManager:
         self._loggers: Dict[str, logging.Logger] = {}
         self._global_level: Optional[int] = None
         self._global_format: Optional[str] = None
+        
+        # 檔案寫入交由背景執行緒處理，呼叫端只需將記錄放入佇列；
+        # 每個檔案處理器各自擁有一組佇列與背景執行緒，以 Logger 名稱為鍵
+        self._listeners: Dict[str, _FileQueueListener] = {}
+        self._file_handlers: List[logging.Handler] = []
+        
+        # 控制台處理器依格式字串共用，同格式的 Logger 共用同一個 StreamHandler
+        self._console_handlers: Dict[str, logging.StreamHandler] = {}
+        
+        # 以 (name, log_file, level, format_string) 快取 Logger，重複呼叫不需再走建立流程
+        self._get = functools.lru_cache(maxsize=512)(self._build_logger)
     
     def get_logger(self, name: str, log_file: Optional[str] = None, 
                    level: int = logging.INFO, 
@@ -41,6 +186,11 @@ class LoggerManager:
         Returns:
             Logger 實例
         """
+        return self._get(name, log_file, level, format_string)
+    
+    def _build_logger(self, name: str, log_file: Optional[str],
+                      level: int, format_string: Optional[str]) -> logging.Logger:
+        """建立 Logger 並設定處理器（未經快取的實際建立流程）"""
         if name in self._loggers:
             return self._loggers[name]
         
@@ -61,12 +211,10 @@ class LoggerManager:
         elif not format_string:
             format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         
-        formatter = logging.Formatter(format_string)
+        formatter = _get_formatter(format_string)
         
         # 添加控制台處理器
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        logger.addHandler(self._get_console_handler(format_string))
         
         # 添加檔案處理器（如果指定）
         if log_file:
@@ -75,9 +223,17 @@ class LoggerManager:
                 log_path = Path(log_file)
                 log_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                file_handler = logging.FileHandler(log_file, encoding='utf-8')
+                # 延遲到第一筆記錄寫入時才開啟檔案，未輸出的 Logger 不佔用檔案描述符
+                file_handler = RawUtf8FileHandler(log_file, encoding='utf-8', delay=True)
                 file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                
+                self._file_handlers.append(file_handler)
+                log_queue: queue.Queue = queue.Queue(-1)
+                listener = _FileQueueListener(log_queue, file_handler,
+                                              respect_handler_level=True)
+                listener.start()
+                self._listeners[name] = listener
+                logger.addHandler(logging.handlers.QueueHandler(log_queue))
             except (OSError, PermissionError) as e:
                 # 檔案處理器創建失敗時，記錄到控制台
                 logger.warning(f"無法創建檔案處理器 {log_file}: {e}")
@@ -111,26 +267,87 @@ class LoggerManager:
             format_string: 格式字串
         """
         self._global_format = format_string
-        formatter = logging.Formatter(format_string)
+        formatter = _get_formatter(format_string)
+        
+        # 更新所有現有 Logger 的格式（佇列處理器只傳遞原始訊息，不套用格式）
+        for handler in self._console_handlers.values():
+            handler.setFormatter(formatter)
+        
+        for handler in self._file_handlers:
+            handler.setFormatter(formatter)
+    
+    def _get_console_handler(self, format_string: str) -> logging.StreamHandler:
+        """取得指定格式的共用控制台處理器"""
+        handler = self._console_handlers.get(format_string)
+        if handler is None:
+            handler = logging.StreamHandler()
+            handler.setFormatter(_get_formatter(format_string))
+            self._console_handlers[format_string] = handler
+        return handler
+    
+    def _stop_listeners(self):
+        """停止所有背景寫入執行緒，停止前會先處理完佇列中的記錄"""
+        listeners = list(self._listeners.values())
+        self._listeners.clear()
+        for listener in listeners:
+            listener.stop()
+    
+    def _flush_file_handlers(self):
+        """將檔案處理器的緩衝寫出"""
+        for handler in self._file_handlers[:]:
+            handler.flush()
+    
+    def _wait_for_queue(self):
+        """等待背景執行緒處理完佇列中的記錄，執行緒已停止時不再等待"""
+        for listener in list(self._listeners.values()):
+            log_queue = listener.queue
+            with log_queue.all_tasks_done:
+                while log_queue.unfinished_tasks and listener.is_alive():
+                    log_queue.all_tasks_done.wait(0.1)
+    
+    def flush(self):
+        """將所有 Logger 緩衝中的記錄寫入檔案"""
+        self._wait_for_queue()
         
-        # 更新所有現有 Logger 的格式
         for logger in self._loggers.values():
             for handler in logger.handlers:
-                handler.setFormatter(formatter)
+                handler.flush()
+        
+        self._flush_file_handlers()
     
     def cleanup(self):
         """清理所有 Logger 的處理器"""
+        self._stop_listeners()
+        
         for logger in self._loggers.values():
             for handler in logger.handlers[:]:
                 handler.close()
                 logger.removeHandler(handler)
         
+        for handler in self._file_handlers:
+            handler.close()
+        
+        self._file_handlers.clear()
+        self._console_handlers.clear()
         self._loggers.clear()
+        self._get.cache_clear()
+    
+    def reset(self):
+        """清理所有 Logger 並清除全域級別與格式設定，回到初始狀態"""
+        self.cleanup()
+        self._global_level = None
+        self._global_format = None
 
 
 # 全域 Logger 管理器實例
 _logger_manager = LoggerManager()
 
+# 已載入的日誌配置，以配置檔案路徑為鍵並記錄載入時的修改時間，檔案變更後重新解析
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+# 程式結束前停止背景寫入執行緒，確保佇列中的記錄寫入檔案
+atexit.register(_logger_manager._stop_listeners)
+
 
 def setup_logger(name: str, 
                  log_file: Optional[str] = None,
@@ -150,6 +367,11 @@ def setup_logger(name: str,
     Returns:
         Logger 實例
         
+    Note:
+        指定 log_file 時，記錄由背景執行緒寫入檔案：佇列清空或出現 ERROR 以上
+        級別的記錄時立即寫出，高負載下累積的記錄則合併為一次寫入。需要確認記錄
+        已落地（例如讀取日誌檔前）時呼叫 flush_loggers()。
+        
     Examples:
         >>> logger = setup_logger("my_module")
         >>> logger.info("這是一條資訊日誌")
@@ -163,11 +385,21 @@ def setup_logger(name: str,
     # 如果提供配置檔案路徑，嘗試從配置中載入設定
     if config_path:
         try:
-            from config.config_manager import ConfigManager
+            try:
+                mtime_ns = os.stat(config_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
             
-            config_manager = ConfigManager()
-            config_manager.load_config(config_path)
-            logging_config = config_manager.get_logging_config()
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[0] == mtime_ns:
+                logging_config = cached[1]
+            else:
+                from config.config_manager import ConfigManager
+                
+                config_manager = ConfigManager()
+                config_manager.load_config(config_path)
+                logging_config = config_manager.get_logging_config()
+                _CONFIG_CACHE[config_path] = (mtime_ns, logging_config)
             
             # 從配置中提取設定
             if 'level' in logging_config:
@@ -230,6 +462,24 @@ def set_global_log_format(format_string: str):
     _logger_manager.set_global_format(format_string)
 
 
+def flush_loggers():
+    """將所有 Logger 緩衝中的記錄寫入檔案"""
+    _logger_manager.flush()
+
+
+def reload_config(config_path: Optional[str] = None):
+    """
+    清除已快取的日誌配置，下次 setup_logger 時重新載入
+    
+    Args:
+        config_path: 配置檔案路徑，未指定時清除全部快取
+    """
+    if config_path is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(config_path, None)
+
+
 def cleanup_loggers():
     """清理所有 Logger 的處理器"""
     _logger_manager.cleanup()
@@ -271,7 +521,7 @@ class RotatingLogger:
         )
         
         # 設定格式
-        formatter = logging.Formatter(
+        formatter = _get_formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         handler.setFormatter(formatter)
@@ -323,7 +573,7 @@ class TimedRotatingLogger:
         )
         
         # 設定格式
-        formatter = logging.Formatter(
+        formatter = _get_formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         handler.setFormatter(formatter)
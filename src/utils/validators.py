@@ -12,11 +12,30 @@
 
 import os
 import re
+import stat
 from typing import Dict, List, Any, Optional, Union, Callable
 from pathlib import Path
 from dataclasses import dataclass
 
 
+# 標準 TCG-XXX.YYY.ZZZ 測試案例編號格式，模組載入時編譯一次
+_TEST_CASE_NUMBER_PATTERN = re.compile(r'^TCG-\d{3}\.\d{3}\.\d{3}$')
+
+# 預設允許的優先級值（小寫），比對前輸入會先去除空白並轉為小寫
+_DEFAULT_PRIORITIES = frozenset({"high", "medium", "low"})
+
+# 基本電子郵件格式（平衡版）：允許 + 符號，連續的點另行檢查
+_EMAIL_PATTERN = re.compile(
+    r'^[a-zA-Z0-9]([a-zA-Z0-9._+%-]*[a-zA-Z0-9])?@[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?\.[a-zA-Z]{2,}$'
+)
+
+# 預設允許的 URL 協議與其對應的編譯後模式
+_DEFAULT_URL_SCHEMES = ("http", "https")
+_DEFAULT_URL_PATTERN = re.compile(
+    r'^(' + '|'.join(_DEFAULT_URL_SCHEMES) + r')://[^\s/$.?#].[^\s]*$', re.IGNORECASE
+)
+
+
 class ValidationError(Exception):
     """資料驗證錯誤的自訂異常"""
     
@@ -81,12 +100,11 @@ def validate_file_path(file_path: Union[str, Path, None],
     try:
         path = Path(file_path)
         
-        # 檢查檔案是否存在
-        if not path.exists():
-            return False
+        # 只 stat 一次，存在性、檔案類型與大小都由同一個結果判斷
+        file_stat = os.stat(path)
         
-        # 檢查是否為檔案（不是目錄）
-        if not path.is_file():
+        # 檢查是否為一般檔案（不是目錄）
+        if not stat.S_ISREG(file_stat.st_mode):
             return False
         
         # 檢查副檔名
@@ -96,7 +114,7 @@ def validate_file_path(file_path: Union[str, Path, None],
         
         # 檢查檔案大小
         if max_size_mb is not None:
-            file_size_mb = path.stat().st_size / (1024 * 1024)
+            file_size_mb = file_stat.st_size / (1024 * 1024)
             if file_size_mb > max_size_mb:
                 return False
         
@@ -112,14 +130,14 @@ def validate_file_path(file_path: Union[str, Path, None],
 
 
 def validate_test_case_number(case_number: Union[str, None], 
-                             pattern: Optional[str] = None,
+                             pattern: Union[str, re.Pattern, None] = None,
                              strip_whitespace: bool = True) -> bool:
     """
     驗證測試案例編號格式
     
     Args:
         case_number: 測試案例編號
-        pattern: 自訂正則表達式模式（預設為 TCG-XXX.YYY.ZZZ 格式）
+        pattern: 自訂正則表達式模式，可為字串或已編譯的 re.Pattern（預設為 TCG-XXX.YYY.ZZZ 格式）
         strip_whitespace: 是否清理前後空白
         
     Returns:
@@ -143,12 +161,13 @@ def validate_test_case_number(case_number: Union[str, None],
     if strip_whitespace and isinstance(case_number, str):
         case_number = case_number.strip()
     
-    # 使用預設模式或自訂模式
+    # 使用預設模式或自訂模式，已編譯的模式直接比對不再經過 re 模組快取
     if pattern is None:
-        # 標準 TCG-XXX.YYY.ZZZ 格式
-        pattern = r'^TCG-\d{3}\.\d{3}\.\d{3}$'
+        pattern = _TEST_CASE_NUMBER_PATTERN
     
     try:
+        if isinstance(pattern, re.Pattern):
+            return bool(pattern.match(case_number))
         return bool(re.match(pattern, case_number))
     except (re.error, TypeError):
         return False
@@ -183,13 +202,11 @@ def validate_priority_value(priority: Union[str, None],
     if not priority:
         return False
     
-    # 使用預設值或自訂值
-    if allowed_values is None:
-        allowed_values = ["High", "Medium", "Low"]
-    
-    # 清理空白並轉換為小寫進行比較
+    # 清理空白並轉換為小寫進行比較，預設值直接查詢預先建立的集合
     try:
         priority_clean = priority.strip().lower()
+        if allowed_values is None:
+            return priority_clean in _DEFAULT_PRIORITIES
         allowed_lower = [val.lower() for val in allowed_values]
         return priority_clean in allowed_lower
     except (AttributeError, TypeError):
@@ -264,15 +281,12 @@ def validate_email_format(email: Union[str, None]) -> bool:
     if not email:
         return False
     
-    # 基本電子郵件格式驗證（平衡版）
-    # 允許 + 符號，但不允許連續的點
-    if '..' in email:
+    # 不允許連續的點；沒有 @ 的字串必定無效，不必進入正則比對
+    if '..' in email or '@' not in email:
         return False
     
-    email_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9._+%-]*[a-zA-Z0-9])?@[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?\.[a-zA-Z]{2,}$'
-    
     try:
-        return bool(re.match(email_pattern, email.strip()))
+        return bool(_EMAIL_PATTERN.match(email.strip()))
     except (AttributeError, TypeError):
         return False
 
@@ -302,13 +316,12 @@ def validate_url_format(url: Union[str, None],
     if not url:
         return False
     
-    if allowed_schemes is None:
-        allowed_schemes = ["http", "https"]
-    
-    # 基本 URL 格式驗證
-    url_pattern = r'^(' + '|'.join(allowed_schemes) + r')://[^\s/$.?#].[^\s]*$'
-    
+    # 基本 URL 格式驗證，預設協議使用預先編譯的模式
     try:
+        if allowed_schemes is None:
+            return bool(_DEFAULT_URL_PATTERN.match(url.strip()))
+        
+        url_pattern = r'^(' + '|'.join(allowed_schemes) + r')://[^\s/$.?#].[^\s]*$'
         return bool(re.match(url_pattern, url.strip(), re.IGNORECASE))
     except (AttributeError, TypeError):
         return False
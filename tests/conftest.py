@@ -14,10 +14,61 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
+# 專案根目錄另有同名的 main.py，趁 src 位於路徑最前面時先載入 src/main.py，
+# 之後測試模組的 `from main import ...` 都取得這個已載入的模組
+import main  # noqa: E402,F401
+
 # 匯入測試輔助工具
 from tests.test_helpers import xml_helper, lark_helper, file_helper, data_helper
 
 
+def pytest_addoption(parser):
+    """註冊慢速測試門檻選項"""
+    parser.addoption(
+        "--max-test-duration",
+        type=float,
+        default=None,
+        help="單一測試允許的最長執行秒數，超過時整體測試失敗（CI 使用，例如 0.1）",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """-m 運算式未提及 perf 時略過效能測試，避免一般執行與其他標記篩選跑到它們"""
+    if "perf" in (config.getoption("-m") or ""):
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.get_closest_marker("perf") else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_runtest_makereport(item, call):
+    """記錄執行時間超過門檻的測試"""
+    threshold = item.config.getoption("--max-test-duration")
+    if threshold is not None and call.when == "call" and call.duration > threshold:
+        item.config._slow_tests = getattr(item.config, "_slow_tests", [])
+        item.config._slow_tests.append((item.nodeid, call.duration))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """有測試超過執行時間門檻時讓整體測試失敗"""
+    slow_tests = getattr(session.config, "_slow_tests", [])
+    if not slow_tests:
+        return
+
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        threshold = session.config.getoption("--max-test-duration")
+        reporter.write_sep("=", f"超過 {threshold}s 的慢速測試", red=True)
+        for nodeid, duration in sorted(slow_tests, key=lambda x: -x[1]):
+            reporter.write_line(f"{duration:.3f}s {nodeid}")
+
+    session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
 @pytest.fixture
 def project_root_path():
     """提供專案根目錄路徑"""
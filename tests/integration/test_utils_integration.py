@@ -19,7 +19,9 @@ from unittest.mock import Mock, patch
 # 加入 src 目錄到 Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from utils.logger import setup_logger, LoggerManager, get_logger_manager
+from utils.logger import (
+    setup_logger, LoggerManager, get_logger_manager, flush_loggers, reload_config
+)
 from utils.validators import (
     validate_file_path, validate_test_case_number, validate_priority_value,
     validate_required_fields, FieldValidator, ValidationError
@@ -32,12 +34,8 @@ class TestLoggerValidatorIntegration:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理日誌管理器
-        get_logger_manager().cleanup()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
-        manager._global_level = None
+        # 清理日誌管理器並重置全域設定
+        get_logger_manager().reset()
     
     def test_logger_with_validation_workflow(self):
         """測試日誌記錄驗證工作流程"""
@@ -78,6 +76,8 @@ class TestLoggerValidatorIntegration:
             logger.info("驗證工作流程完成")
             
             # 檢查日誌檔案內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -113,6 +113,8 @@ class TestLoggerValidatorIntegration:
                 logger.error("必要欄位驗證失敗")
             
             # 檢查日誌檔案內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -155,6 +157,8 @@ class TestLoggerValidatorIntegration:
                         logger.error(f"  {field}: {error}")
             
             # 檢查日誌內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -167,12 +171,9 @@ class TestUtilsConfigIntegration:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理日誌管理器
-        get_logger_manager().cleanup()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
-        manager._global_level = None
+        # 清理日誌管理器並重置全域設定
+        get_logger_manager().reset()
+        reload_config()
     
     def test_logger_with_config_manager(self):
         """測試日誌管理器與配置管理器整合"""
@@ -227,12 +228,8 @@ class TestFileValidationWithLogging:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理日誌管理器
-        get_logger_manager().cleanup()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
-        manager._global_level = None
+        # 清理日誌管理器並重置全域設定
+        get_logger_manager().reset()
     
     def test_file_validation_workflow(self):
         """測試檔案驗證工作流程"""
@@ -279,6 +276,8 @@ class TestFileValidationWithLogging:
             assert test_file_path in valid_files
             
             # 檢查日誌內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -293,12 +292,8 @@ class TestCompleteWorkflowIntegration:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理日誌管理器
-        get_logger_manager().cleanup()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
-        manager._global_level = None
+        # 清理日誌管理器並重置全域設定
+        get_logger_manager().reset()
     
     def test_complete_data_processing_workflow(self):
         """測試完整的資料處理工作流程"""
@@ -391,6 +386,8 @@ class TestCompleteWorkflowIntegration:
             assert len(valid_cases) == 2  # 兩個測試案例都應該通過
             
             # 檢查日誌內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -412,12 +409,8 @@ class TestErrorHandlingIntegration:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理日誌管理器
-        get_logger_manager().cleanup()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
-        manager._global_level = None
+        # 清理日誌管理器並重置全域設定
+        get_logger_manager().reset()
     
     def test_validation_error_with_logging(self):
         """測試驗證錯誤與日誌記錄整合"""
@@ -446,6 +439,8 @@ class TestErrorHandlingIntegration:
                 logger.info("錯誤處理完成，繼續執行")
             
             # 檢查日誌內容
+            flush_loggers()
+
             with open(log_file, 'r', encoding='utf-8') as f:
                 log_content = f.read()
             
@@ -4,13 +4,22 @@
 提供測試過程中需要的共用工具和輔助函數
 """
 
+import functools
 import json
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Any
 from unittest.mock import Mock
 
 
+@functools.lru_cache(maxsize=None)
+def _read_xml_fixture_bytes(filename: str) -> bytes:
+    """讀取 XML 測試檔案內容，同一檔案在整個測試階段只從磁碟讀取一次"""
+    fixture_path = Path(__file__).parent / "fixtures" / "xml" / filename
+    return fixture_path.read_bytes()
+
+
 class XMLTestHelper:
     """XML 測試輔助類別"""
     
@@ -19,15 +28,16 @@ class XMLTestHelper:
         """
         載入測試用 XML 檔案
         
+        檔案內容只讀取一次，每次呼叫都重新解析出獨立的根元素，
+        測試可自由修改回傳的樹而不影響其他測試
+        
         Args:
             filename: XML 檔案名稱（不含路徑）
             
         Returns:
             ET.Element: XML 根元素
         """
-        fixture_path = Path(__file__).parent / "fixtures" / "xml" / filename
-        tree = ET.parse(fixture_path)
-        return tree.getroot()
+        return ET.fromstring(_read_xml_fixture_bytes(filename))
     
     @staticmethod
     def create_test_xml_element(tag: str, text: str = None, **attributes) -> ET.Element:
@@ -138,6 +148,19 @@ class FileTestHelper:
             with open(fixture_path, 'r', encoding='utf-8') as f:
                 return f.read()
     
+    @staticmethod
+    def temp_dir() -> Path:
+        """
+        取得目前測試程序使用的臨時目錄
+        
+        以 pytest-xdist 平行執行時，每個 worker 使用各自的子目錄，
+        避免同名檔案互相覆寫或被其他 worker 的清理動作刪除
+        
+        Returns:
+            Path: 臨時目錄路徑（tests/temp 或 tests/temp/<worker id>）
+        """
+        return Path(__file__).parent / "temp" / os.environ.get("PYTEST_XDIST_WORKER", "")
+    
     @staticmethod
     def create_temp_file(content: str, filename: str = "temp_test_file.txt") -> Path:
         """
@@ -150,8 +173,8 @@ class FileTestHelper:
         Returns:
             Path: 臨時檔案路徑
         """
-        temp_dir = Path(__file__).parent / "temp"
-        temp_dir.mkdir(exist_ok=True)
+        temp_dir = FileTestHelper.temp_dir()
+        temp_dir.mkdir(parents=True, exist_ok=True)
         
         temp_file = temp_dir / filename
         with open(temp_file, 'w', encoding='utf-8') as f:
@@ -165,10 +188,10 @@ class FileTestHelper:
         清理臨時測試檔案
         
         Args:
-            temp_dir: 臨時目錄路徑，預設為 tests/temp
+            temp_dir: 臨時目錄路徑，預設為目前測試程序的臨時目錄
         """
         if temp_dir is None:
-            temp_dir = Path(__file__).parent / "temp"
+            temp_dir = FileTestHelper.temp_dir()
         
         if temp_dir.exists():
             for file in temp_dir.glob("*"):
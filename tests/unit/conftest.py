@@ -0,0 +1,19 @@
+"""
+單元測試共用 fixture
+"""
+
+import pytest
+
+
+@pytest.fixture
+def patch_main(mocker):
+    """
+    替換 main 模組中指定名稱的相依物件，測試結束後由 mocker 自動還原
+    
+    用法：``mocks = patch_main('InteractiveCLI', 'main_conversion_flow')``，
+    回傳以名稱為鍵的 mock 字典，每個測試只替換自己用到的相依物件。
+    """
+    def _patch(*names):
+        return {name: mocker.patch(f"main.{name}") for name in names}
+    return _patch
+
@@ -189,15 +189,3 @@ class TestSimpleLarkClientCore:
         # 重置 Rate Limit
         client._reset_rate_limit()
         assert client.rate_limit_remaining == client.rate_limit_max
-
-
-class TestLarkAPIError:
-    """LarkAPIError 異常測試"""
-
-    def test_lark_api_error_creation(self):
-        """測試 LarkAPIError 建立"""
-        error_msg = "測試錯誤訊息"
-        error = LarkAPIError(error_msg)
-        
-        assert str(error) == error_msg
-        assert isinstance(error, Exception)
\ No newline at end of file
@@ -10,31 +10,57 @@
 """
 
 import pytest
-import sys
 import os
-import tempfile
+import time
 import logging
+import logging.handlers
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-
-# 加入 src 目錄到 Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from utils.logger import (
     setup_logger, LoggerManager, get_logger_manager,
-    set_global_log_level, set_global_log_format, cleanup_loggers
+    set_global_log_level, set_global_log_format, cleanup_loggers, flush_loggers,
+    reload_config, FastFormatter, RotatingLogger, TimedRotatingLogger
 )
 
 
+@pytest.fixture(scope="module")
+def log_dir(tmp_path_factory):
+    """整個模組共用的日誌目錄，各測試使用不同檔名"""
+    return tmp_path_factory.mktemp("loggers")
+
+
+@pytest.fixture
+def fake_config_manager(monkeypatch):
+    """以輕量替身取代 ConfigManager，記錄載入過的配置路徑"""
+    class FakeConfigManager:
+        logging_config = {
+            "level": "DEBUG",
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "file": "logs/test_config.log"
+        }
+        load_error = None
+        loaded = []
+        
+        def load_config(self, config_path):
+            FakeConfigManager.loaded.append(config_path)
+            if self.load_error:
+                raise self.load_error
+        
+        def get_logging_config(self):
+            return self.logging_config
+    
+    monkeypatch.setattr('config.config_manager.ConfigManager', FakeConfigManager)
+    return FakeConfigManager
+
+
 class TestSetupLogger:
     """setup_logger 函數測試"""
     
     def setup_method(self):
         """每個測試方法前的設定"""
         # 清理已存在的 loggers 避免測試間互相影響
-        for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-            if logger_name.startswith('test_'):
-                logging.getLogger(logger_name).handlers.clear()
+        cleanup_loggers()
+        reload_config()
     
     def test_setup_logger_basic(self):
         """測試基本日誌設定"""
@@ -70,46 +96,78 @@ class TestSetupLogger:
         
         assert logger.level == logging.DEBUG
     
-    def test_setup_logger_with_file_handler(self):
+    def test_setup_logger_with_file_handler(self, log_dir):
         """測試檔案處理器設定"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "test.log")
-            logger = setup_logger("test_file", log_file=log_file)
-            
-            # 檢查是否有檔案處理器
-            file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-            assert len(file_handlers) > 0
-            
-            # 測試寫入日誌
-            logger.info("測試訊息")
-            
-            # 確保檔案被創建且有內容
-            assert os.path.exists(log_file)
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "測試訊息" in content
+        log_file = str(log_dir / "test.log")
+        logger = setup_logger("test_file", log_file=log_file)
+        
+        # 檢查是否有檔案處理器（經由佇列交給背景執行緒寫入）
+        queue_handlers = [h for h in logger.handlers
+                          if isinstance(h, logging.handlers.QueueHandler)]
+        assert len(queue_handlers) > 0
+        listener = get_logger_manager()._listeners["test_file"]
+        assert listener.queue is queue_handlers[0].queue
+        file_handler = listener.handlers[0]
+        assert isinstance(file_handler, logging.FileHandler)
+        assert file_handler._buffer_size() % os.stat(log_dir).st_blksize == 0
+        
+        # 尚未寫入記錄前不應開啟檔案
+        assert file_handler.stream is None
+        assert not os.path.exists(log_file)
+        
+        # 測試寫入日誌
+        logger.info("測試訊息")
+        flush_loggers()
+        
+        # 確保檔案被創建且有內容
+        assert os.path.exists(log_file)
+
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "測試訊息" in content
     
-    def test_setup_logger_with_config_file(self):
+    def test_file_logger_writes_without_explicit_flush(self, log_dir):
+        """測試背景執行緒在佇列清空後即寫出記錄，不需呼叫 flush_loggers"""
+        log_file = log_dir / "no_flush.log"
+        logger = setup_logger("test_no_flush", log_file=str(log_file))
+        
+        logger.info("不需 flush 的訊息")
+        
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if log_file.exists() and "不需 flush 的訊息" in log_file.read_text(encoding='utf-8'):
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("記錄未在佇列清空後寫入檔案")
+    
+    def test_setup_logger_with_config_file(self, fake_config_manager):
         """測試使用設定檔"""
-        config_data = {
-            "logging": {
-                "level": "DEBUG",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "file": "logs/test_config.log"
-            }
-        }
+        logger = setup_logger("test_config", config_path="test_config.yaml")
         
-        with patch('config.config_manager.ConfigManager') as mock_config_manager:
-            mock_config = Mock()
-            mock_config.get_logging_config.return_value = config_data["logging"]
-            mock_config_manager.return_value = mock_config
-            
-            logger = setup_logger("test_config", config_path="test_config.yaml")
-            
-            # 驗證設定被正確載入
-            assert logger.level == logging.DEBUG
-            mock_config_manager.assert_called_once()
-            mock_config.load_config.assert_called_once_with("test_config.yaml")
+        # 驗證設定被正確載入
+        assert logger.level == logging.DEBUG
+        assert fake_config_manager.loaded == ["test_config.yaml"]
+        
+        # 相同配置檔案不會重複載入
+        setup_logger("test_config_again", config_path="test_config.yaml")
+        assert fake_config_manager.loaded == ["test_config.yaml"]
+    
+    def test_setup_logger_reloads_modified_config_file(self, fake_config_manager, tmp_path):
+        """測試配置檔案修改後重新載入"""
+        config_file = tmp_path / "logging.yaml"
+        config_file.write_text("logging: {}", encoding="utf-8")
+        config_path = str(config_file)
+        
+        setup_logger("test_config_mtime", config_path=config_path)
+        setup_logger("test_config_mtime_same", config_path=config_path)
+        assert fake_config_manager.loaded == [config_path]
+        
+        # 修改時間變更後應重新載入
+        stat_result = os.stat(config_path)
+        os.utime(config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        setup_logger("test_config_mtime_changed", config_path=config_path)
+        assert fake_config_manager.loaded == [config_path, config_path]
     
     def test_setup_logger_error_handling(self):
         """測試錯誤處理"""
@@ -125,71 +183,94 @@ class TestSetupLogger:
         console_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)]
         assert len(console_handlers) > 0
     
-    def test_logger_output_levels(self):
+    def test_logger_output_levels(self, log_dir):
         """測試不同級別的日誌輸出"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "levels_test.log")
-            logger = setup_logger("test_levels", log_file=log_file, level=logging.DEBUG)
-            
-            # 測試各種級別的日誌
-            logger.debug("Debug 訊息")
-            logger.info("Info 訊息")
-            logger.warning("Warning 訊息")
-            logger.error("Error 訊息")
-            logger.critical("Critical 訊息")
+        log_file = str(log_dir / "levels_test.log")
+        logger = setup_logger("test_levels", log_file=log_file, level=logging.DEBUG)
+        
+        # 測試各種級別的日誌
+        logger.debug("Debug 訊息")
+        logger.info("Info 訊息")
+        logger.warning("Warning 訊息")
+        logger.error("Error 訊息")
+        logger.critical("Critical 訊息")
+        
+        # 讀取檔案內容
+        flush_loggers()
+
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
             
-            # 讀取檔案內容
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # 驗證所有級別的訊息都被記錄
-            assert "Debug 訊息" in content
-            assert "Info 訊息" in content
-            assert "Warning 訊息" in content
-            assert "Error 訊息" in content
-            assert "Critical 訊息" in content
-    
-    def test_logger_format(self):
+        # 驗證所有級別的訊息都被記錄
+        expected = ["Debug 訊息", "Info 訊息", "Warning 訊息", "Error 訊息", "Critical 訊息"]
+        missing = [msg for msg in expected if msg not in content]
+        assert not missing, missing
+    
+    def test_logger_format(self, log_dir):
         """測試日誌格式"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "format_test.log")
-            custom_format = "%(levelname)s - %(name)s - %(message)s"
-            logger = setup_logger("test_format", log_file=log_file, 
-                                format_string=custom_format)
-            
-            logger.info("格式測試訊息")
+        log_file = str(log_dir / "format_test.log")
+        custom_format = "%(levelname)s - %(name)s - %(message)s"
+        logger = setup_logger("test_format", log_file=log_file, 
+                            format_string=custom_format)
+        
+        logger.info("格式測試訊息")
+        
+        flush_loggers()
+
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # 驗證格式正確
-            assert "INFO - test_format - 格式測試訊息" in content
+        # 驗證格式正確
+        assert "INFO - test_format - 格式測試訊息" in content
+    
+    def test_logger_level_filter_keeps_caller(self, log_dir):
+        """測試級別過濾且保留實際呼叫端資訊"""
+        log_file = str(log_dir / "caller_test.log")
+        logger = setup_logger("test_caller", level="INFO", log_file=log_file,
+                            format_string="%(funcName)s - %(levelname)s - %(message)s")
+        
+        logger.debug("不應輸出")
+        logger.info("呼叫端訊息")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("例外訊息")
+        
+        flush_loggers()
+        
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        assert "不應輸出" not in content
+        assert "test_logger_level_filter_keeps_caller - INFO - 呼叫端訊息" in content
+        assert "test_logger_level_filter_keeps_caller - ERROR - 例外訊息" in content
     
-    def test_logger_unicode_support(self):
+    def test_logger_unicode_support(self, log_dir):
         """測試 Unicode 字符支援"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "unicode_test.log")
-            logger = setup_logger("test_unicode", log_file=log_file)
-            
-            # 測試各種 Unicode 字符
-            test_messages = [
-                "中文測試訊息",
-                "English test message",
-                "日本語テストメッセージ",
-                "한글 테스트 메시지",
-                "Ελληνικά τεστ μήνυμα",
-                "🚀 Emoji test 📝"
-            ]
-            
-            for msg in test_messages:
-                logger.info(msg)
+        log_file = str(log_dir / "unicode_test.log")
+        logger = setup_logger("test_unicode", log_file=log_file)
+        
+        # 測試各種 Unicode 字符
+        test_messages = [
+            "中文測試訊息",
+            "English test message",
+            "日本語テストメッセージ",
+            "한글 테스트 메시지",
+            "Ελληνικά τεστ μήνυμα",
+            "🚀 Emoji test 📝"
+        ]
+        
+        for msg in test_messages:
+            logger.info(msg)
+        
+        flush_loggers()
+
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # 驗證所有訊息都正確記錄
-            for msg in test_messages:
-                assert msg in content
+        # 驗證所有訊息都正確記錄
+        missing = [msg for msg in test_messages if msg not in content]
+        assert not missing, missing
 
 
 class TestLoggerManager:
@@ -197,14 +278,16 @@ class TestLoggerManager:
     
     def setup_method(self):
         """每個測試方法前的設定"""
-        # 清理已存在的 loggers
-        for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-            if logger_name.startswith('test_manager_'):
-                logging.getLogger(logger_name).handlers.clear()
+        # 共用全域 LoggerManager，重置全域設定以隔離各測試
+        get_logger_manager().reset()
+    
+    def teardown_method(self):
+        """每個測試方法後的清理，避免全域設定影響其他測試類別"""
+        self.setup_method()
     
     def test_logger_manager_initialization(self):
         """測試 LoggerManager 初始化"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         
         assert hasattr(manager, 'get_logger')
         assert hasattr(manager, 'set_global_level')
@@ -212,7 +295,7 @@ class TestLoggerManager:
     
     def test_get_logger_basic(self):
         """測試基本 logger 獲取"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         logger = manager.get_logger("test_manager_basic")
         
         assert isinstance(logger, logging.Logger)
@@ -220,14 +303,14 @@ class TestLoggerManager:
     
     def test_get_logger_with_module_path(self):
         """測試使用模組路徑獲取 logger"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         logger = manager.get_logger("test_manager.module.submodule")
         
         assert logger.name == "test_manager.module.submodule"
     
     def test_set_global_level(self):
         """測試設定全域日誌級別"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         
         # 創建幾個 logger
         logger1 = manager.get_logger("test_manager_level1")
@@ -240,39 +323,53 @@ class TestLoggerManager:
         assert logger1.level == logging.WARNING
         assert logger2.level == logging.WARNING
     
-    def test_set_global_format(self):
+    def test_set_global_format(self, log_dir):
         """測試設定全域日誌格式"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "global_format_test.log")
-            logger = manager.get_logger("test_manager_format", log_file=log_file)
-            
-            # 設定全域格式
-            new_format = "GLOBAL: %(levelname)s - %(message)s"
-            manager.set_global_format(new_format)
-            
-            logger.info("全域格式測試")
+        log_file = str(log_dir / "global_format_test.log")
+        logger = manager.get_logger("test_manager_format", log_file=log_file)
+        
+        # 設定全域格式
+        new_format = "GLOBAL: %(levelname)s - %(message)s"
+        manager.set_global_format(new_format)
+        
+        logger.info("全域格式測試")
+        
+        manager.flush()
+
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            assert "GLOBAL: INFO - 全域格式測試" in content
+        assert "GLOBAL: INFO - 全域格式測試" in content
     
     def test_logger_manager_caching(self):
         """測試 LoggerManager 快取機制"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         
         # 多次獲取相同名稱的 logger
         logger1 = manager.get_logger("test_manager_cache")
         logger2 = manager.get_logger("test_manager_cache")
         
-        # 應該返回相同的實例
+        # 應該返回相同的實例，且第二次呼叫命中快取
         assert logger1 is logger2
+        assert manager._get.cache_info().hits == 1
+    
+    def test_logger_manager_shares_formatter(self):
+        """測試相同格式字串的 Logger 共用 Formatter"""
+        manager = get_logger_manager()
+        fmt = "SHARED: %(message)s"
+        
+        logger1 = manager.get_logger("test_manager_fmt1", format_string=fmt)
+        logger2 = manager.get_logger("test_manager_fmt2", format_string=fmt)
+        
+        assert logger1.handlers[0].formatter is logger2.handlers[0].formatter
+        # 相同格式的控制台處理器也共用同一個實例
+        assert logger1.handlers[0] is logger2.handlers[0]
     
     def test_logger_manager_cleanup(self):
         """測試 LoggerManager 清理功能"""
-        manager = LoggerManager()
+        manager = get_logger_manager()
         
         # 創建一些 logger
         logger1 = manager.get_logger("test_manager_cleanup1")
@@ -284,139 +381,176 @@ class TestLoggerManager:
         # 驗證 handlers 被清理
         assert len(logger1.handlers) == 0
         assert len(logger2.handlers) == 0
+        assert manager._get.cache_info().currsize == 0
+
+    def test_logger_manager_reset(self):
+        """測試 LoggerManager 重置全域設定"""
+        manager = get_logger_manager()
+        manager.set_global_level(logging.ERROR)
+        manager.set_global_format("RESET: %(message)s")
+
+        manager.reset()
+
+        logger = manager.get_logger("test_manager_reset", level=logging.DEBUG)
+        assert logger.level == logging.DEBUG
+        assert logger.handlers[0].formatter._fmt != "RESET: %(message)s"
 
 
 class TestLoggerIntegration:
     """日誌模組整合測試"""
     
-    def test_multiple_loggers_different_files(self):
+    def setup_method(self):
+        """每個測試方法前的設定"""
+        reload_config()
+    
+    def test_multiple_loggers_different_files(self, log_dir):
         """測試多個 logger 寫入不同檔案"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file1 = os.path.join(temp_dir, "module1.log")
-            file2 = os.path.join(temp_dir, "module2.log")
-            
-            logger1 = setup_logger("module1", log_file=file1)
-            logger2 = setup_logger("module2", log_file=file2)
-            
-            logger1.info("Module1 訊息")
-            logger2.info("Module2 訊息")
-            
-            # 驗證檔案內容
-            with open(file1, 'r', encoding='utf-8') as f:
-                content1 = f.read()
-            with open(file2, 'r', encoding='utf-8') as f:
-                content2 = f.read()
-            
-            assert "Module1 訊息" in content1
-            assert "Module1 訊息" not in content2
-            assert "Module2 訊息" in content2
-            assert "Module2 訊息" not in content1
+        file1 = str(log_dir / "module1.log")
+        file2 = str(log_dir / "module2.log")
+        
+        logger1 = setup_logger("module1", log_file=file1)
+        logger2 = setup_logger("module2", log_file=file2)
+        
+        logger1.info("Module1 訊息")
+        logger2.info("Module2 訊息")
+        
+        # 驗證檔案內容
+        flush_loggers()
+
+        with open(file1, 'r', encoding='utf-8') as f:
+            content1 = f.read()
+        with open(file2, 'r', encoding='utf-8') as f:
+            content2 = f.read()
+        
+        assert "Module1 訊息" in content1
+        assert "Module1 訊息" not in content2
+        assert "Module2 訊息" in content2
+        assert "Module2 訊息" not in content1
     
-    def test_logger_with_config_integration(self):
+    def test_logger_with_config_integration(self, fake_config_manager):
         """測試 logger 與配置管理整合"""
-        # 模擬配置管理器
-        mock_config_data = {
+        fake_config_manager.logging_config = {
             "level": "DEBUG",
             "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             "file": "logs/integration_test.log"
         }
         
-        with patch('config.config_manager.ConfigManager') as mock_config_manager_class:
-            mock_config_manager = Mock()
-            mock_config_manager.load_config.return_value = None
-            mock_config_manager.get_logging_config.return_value = mock_config_data
-            mock_config_manager_class.return_value = mock_config_manager
-            
-            logger = setup_logger("integration_test", config_path="test.yaml")
-            
-            # 驗證配置被正確使用
-            assert logger.level == logging.DEBUG
-            mock_config_manager.load_config.assert_called_once_with("test.yaml")
-            mock_config_manager.get_logging_config.assert_called_once()
+        logger = setup_logger("integration_test", config_path="test.yaml")
+        
+        # 驗證配置被正確使用
+        assert logger.level == logging.DEBUG
+        assert fake_config_manager.loaded == ["test.yaml"]
     
-    def test_logger_error_recovery(self):
+    def test_logger_error_recovery(self, fake_config_manager):
         """測試日誌模組錯誤恢復"""
         # 測試配置載入失敗的情況
-        with patch('config.config_manager.ConfigManager') as mock_config_manager_class:
-            mock_config_manager = Mock()
-            mock_config_manager.load_config.side_effect = Exception("配置載入失敗")
-            mock_config_manager_class.return_value = mock_config_manager
-            
-            # 應該能夠正常創建 logger，使用預設配置
-            logger = setup_logger("error_recovery_test", config_path="invalid.yaml")
-            
-            assert isinstance(logger, logging.Logger)
-            assert logger.level == logging.INFO  # 回退到預設級別
+        fake_config_manager.load_error = Exception("配置載入失敗")
+        
+        # 應該能夠正常創建 logger，使用預設配置
+        logger = setup_logger("error_recovery_test", config_path="invalid.yaml")
+        
+        assert isinstance(logger, logging.Logger)
+        assert logger.level == logging.INFO  # 回退到預設級別
     
     def teardown_method(self):
         """每個測試方法後的清理"""
         # 清理測試產生的 loggers
-        for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-            if logger_name.startswith(('test_', 'module', 'integration_', 'error_recovery_')):
-                logger = logging.getLogger(logger_name)
-                for handler in logger.handlers[:]:
-                    handler.close()
-                    logger.removeHandler(handler)
+        cleanup_loggers()
+
+
+class TestFastFormatter:
+    """FastFormatter 類別測試"""
+    
+    @pytest.mark.parametrize("fmt", [
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "%(levelname)-8s %(message)s",
+        "100%% %(message)s (%(lineno)d)",
+        None,
+    ])
+    def test_matches_standard_formatter(self, fmt):
+        """測試輸出與標準 Formatter 一致"""
+        record = logging.LogRecord("test_fast", logging.INFO, "/tmp/mod.py", 12,
+                                   "訊息 %s", ("參數",), None)
+        
+        fast = FastFormatter(fmt, "%Y-%m-%d")
+        standard = logging.Formatter(fmt, "%Y-%m-%d")
+        
+        assert fast.format(record) == standard.format(record)
+    
+    def test_precompiles_simple_format(self):
+        """測試僅含 %(name)s 欄位的格式會預先解析"""
+        assert FastFormatter("%(name)s: %(message)s")._skeleton == "%s: %s"
+        assert FastFormatter("%(lineno)d %(message)s")._skeleton is None
 
 
 class TestRotatingLogger:
     """RotatingLogger 測試"""
     
-    def test_rotating_logger_initialization(self):
+    def test_rotating_logger_initialization(self, log_dir):
         """測試 RotatingLogger 初始化"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "rotating.log")
-            
-            from utils.logger import RotatingLogger
-            rotating_logger = RotatingLogger("test_rotating", log_file)
-            
-            assert rotating_logger.name == "test_rotating"
-            assert len(rotating_logger.handlers) > 0
+        log_file = str(log_dir / "rotating.log")
+        
+        rotating_logger = RotatingLogger("test_rotating", log_file)
+        
+        assert rotating_logger.name == "test_rotating"
+        assert len(rotating_logger.handlers) > 0
     
-    def test_rotating_logger_logging(self):
+    def test_rotating_logger_logging(self, log_dir):
         """測試 RotatingLogger 日誌記錄"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "rotating.log")
-            
-            from utils.logger import RotatingLogger
-            rotating_logger = RotatingLogger("test_rotating", log_file, max_bytes=1024)
-            
-            rotating_logger.info("測試訊息")
-            
-            assert os.path.exists(log_file)
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "測試訊息" in content
+        log_file = str(log_dir / "rotating_logging.log")
+        
+        rotating_logger = RotatingLogger("test_rotating", log_file, max_bytes=1024)
+        
+        rotating_logger.info("測試訊息")
+        
+        assert os.path.exists(log_file)
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "測試訊息" in content
+    
+    def test_rotating_logger_rollover(self, log_dir):
+        """測試超過大小時輪轉並保留指定數量的備份"""
+        log_file = str(log_dir / "rotating_rollover.log")
+        
+        rotating_logger = RotatingLogger("test_rotating_rollover", log_file,
+                                         max_bytes=200, backup_count=2)
+        
+        for i in range(20):
+            rotating_logger.info(f"輪轉訊息 {i}")
+        
+        assert os.path.exists(log_file)
+        assert os.path.exists(f"{log_file}.1")
+        assert os.path.exists(f"{log_file}.2")
+        assert not os.path.exists(f"{log_file}.3")
+        
+        with open(log_file, 'r', encoding='utf-8') as f:
+            assert "輪轉訊息 19" in f.read()
 
 
 class TestTimedRotatingLogger:
     """TimedRotatingLogger 測試"""
     
-    def test_timed_rotating_logger_initialization(self):
+    def test_timed_rotating_logger_initialization(self, log_dir):
         """測試 TimedRotatingLogger 初始化"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "timed_rotating.log")
-            
-            from utils.logger import TimedRotatingLogger
-            timed_logger = TimedRotatingLogger("test_timed", log_file)
-            
-            assert timed_logger.name == "test_timed"
-            assert len(timed_logger.handlers) > 0
+        log_file = str(log_dir / "timed_rotating.log")
+        
+        timed_logger = TimedRotatingLogger("test_timed", log_file)
+        
+        assert timed_logger.name == "test_timed"
+        assert len(timed_logger.handlers) > 0
     
-    def test_timed_rotating_logger_logging(self):
+    def test_timed_rotating_logger_logging(self, log_dir):
         """測試 TimedRotatingLogger 日誌記錄"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "timed_rotating.log")
-            
-            from utils.logger import TimedRotatingLogger
-            timed_logger = TimedRotatingLogger("test_timed", log_file, backup_count=3)
-            
-            timed_logger.warning("測試警告訊息")
-            
-            assert os.path.exists(log_file)
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "測試警告訊息" in content
+        log_file = str(log_dir / "timed_rotating_logging.log")
+        
+        timed_logger = TimedRotatingLogger("test_timed", log_file, backup_count=3)
+        
+        timed_logger.warning("測試警告訊息")
+        
+        assert os.path.exists(log_file)
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "測試警告訊息" in content
 
 
 class TestGlobalLoggerFunctions:
@@ -443,34 +577,29 @@ class TestGlobalLoggerFunctions:
         assert logger1.level == logging.WARNING
         assert logger2.level == logging.WARNING
     
-    def test_set_global_log_format(self):
+    def test_set_global_log_format(self, log_dir):
         """測試設定全域日誌格式"""
         # 清理環境
         cleanup_loggers()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "global_format.log")
-            
-            # 先設定全域格式，再創建 logger
-            custom_format = "GLOBAL: %(levelname)s - %(message)s"
-            set_global_log_format(custom_format)
-            
-            logger = setup_logger("test_global_format", log_file=log_file)
-            logger.info("全域格式測試")
-            
-            # 確保所有 handlers 都被刷新
-            for handler in logger.handlers:
-                handler.flush()
-            
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                assert "GLOBAL: INFO - 全域格式測試" in content
+        log_file = str(log_dir / "global_format.log")
         
-        # 測試後清理全域格式設定
-        cleanup_loggers()
-        # 重置全域格式
-        manager = get_logger_manager()
-        manager._global_format = None
+        # 先設定全域格式，再創建 logger
+        custom_format = "GLOBAL: %(levelname)s - %(message)s"
+        set_global_log_format(custom_format)
+        
+        logger = setup_logger("test_global_format", log_file=log_file)
+        logger.info("全域格式測試")
+        
+        # 確保緩衝中的記錄都被寫入
+        flush_loggers()
+        
+        with open(log_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "GLOBAL: INFO - 全域格式測試" in content
+        
+        # 測試後清理 Logger 並重置全域格式設定
+        get_logger_manager().reset()
     
     def test_cleanup_loggers(self):
         """測試清理所有 logger"""
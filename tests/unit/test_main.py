@@ -10,229 +10,219 @@
 
 import pytest
 import sys
-import os
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
-
-# 加入 src 目錄到 Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import logging
+from types import MappingProxyType
+from unittest.mock import ANY, Mock, create_autospec
 
 from main import (
     main_conversion_flow,
     handle_conversion_request,
     handle_test_connection,
     parse_command_line_args,
+    _build_parser,
     setup_application_logging,
     main
 )
+from cli.interface import ValidationError
+from config.config_manager import ConfigManager
+from lark.client import SimpleLarkClient
+from parsers import xml_parser, data_cleaner, formatter
+
+
+# 命令列參數樣本（argparse 接受任何序列，不需每次建立新的 list）
+_CONVERSION_ARGS = (
+    "--xml-file", "/path/to/test.xml",
+    "--wiki-token", "docABC123",
+    "--table-id", "tblXYZ789",
+    "--config", "/path/to/config.yaml",
+)
+_TEST_MODE_ARGS = (
+    "--mode", "test",
+    "--wiki-token", "docABC123",
+    "--table-id", "tblXYZ789",
+)
+_MAIN_CONVERT_ARGS = (
+    "--xml-file", "/test/file.xml",
+    "--wiki-token", "docABC123",
+    "--table-id", "tblXYZ789",
+)
+
+
+# 共用的 Lark 設定與測試案例，以唯讀 mapping 保存避免測試間誤改
+_LARK_CFG = MappingProxyType({
+    "app_id": "test_app_id",
+    "app_secret": "test_app_secret",
+})
+_TEST_CASE = MappingProxyType({
+    "test_case_number": "TCG-001.002.003",
+    "title": "登入功能測試",
+    "priority": "High",
+    "precondition": "用戶已註冊",
+    "steps": "1. 打開登入頁面\n2. 輸入憑證",
+    "expected_result": "成功登入",
+})
+_TEST_DATA = (_TEST_CASE,)
+
+
+# 轉換流程中各相依物件的實例 mock 名稱
+CONVERSION_MOCK_SPECS = {
+    'logger': logging.Logger,
+    'config_manager': ConfigManager,
+    'parser': xml_parser.TestRailXMLParser,
+    'cleaner': data_cleaner.TestCaseDataCleaner,
+    'formatter': formatter.LarkDataFormatter,
+    'client': SimpleLarkClient,
+}
+
+
+@pytest.fixture(scope='session')
+def sample_xml_path(tmp_path_factory):
+    """整個測試階段共用的 XML 檔案，轉換流程只讀取其路徑"""
+    path = tmp_path_factory.mktemp('xml') / 't.xml'
+    path.write_bytes(b'<test>content</test>')
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def wired_mocks():
+    """
+    整個測試階段只建立一次的轉換流程 mock，由使用端在每個測試前重置
+    
+    以 create_autospec 依實際類別建立，呼叫不存在的方法或簽章不符時會直接失敗
+    """
+    return {name: create_autospec(spec, instance=True)
+            for name, spec in CONVERSION_MOCK_SPECS.items()}
+
+
+@pytest.fixture(scope='class')
+def _class_logger():
+    """每個測試類別共用的 Logger mock"""
+    return Mock(spec=logging.Logger)
+
+
+@pytest.fixture
+def shared_logger(_class_logger):
+    """提供類別共用的 Logger mock，每個測試使用前先重置呼叫紀錄"""
+    _class_logger.reset_mock()
+    return _class_logger
+
+
+@pytest.fixture
+def lark_cli_mock(patch_main):
+    """替換 main.InteractiveCLI，回傳已預設檔案路徑與 Lark 設定輸入的 CLI mock"""
+    mock_cli = patch_main('InteractiveCLI')['InteractiveCLI'].return_value
+    mock_cli.get_file_path_input.return_value = "/test/file.xml"
+    mock_cli.get_lark_config_input.return_value = {
+        "wiki_token": "docABC123",
+        "table_id": "tblXYZ789"
+    }
+    return mock_cli
+
+
+@pytest.fixture
+def cli_factory(patch_main):
+    """替換 main.InteractiveCLI，回傳主選單依序回傳指定選擇的 CLI mock"""
+    def _make(*choices):
+        mock_cli = patch_main('InteractiveCLI')['InteractiveCLI'].return_value
+        mock_cli.show_main_menu.side_effect = list(choices)
+        return mock_cli
+    return _make
 
 
 class TestMainConversionFlow:
     """主要轉換流程測試"""
     
-    def setup_method(self):
-        """每個測試方法前的設定"""
-        self.mock_config = {
-            "lark": {
-                "app_id": "test_app_id",
-                "app_secret": "test_app_secret"
-            }
-        }
-        
-        self.test_data = [
-            {
-                "test_case_number": "TCG-001.002.003",
-                "title": "登入功能測試",
-                "priority": "High",
-                "precondition": "用戶已註冊",
-                "steps": "1. 打開登入頁面\n2. 輸入憑證",
-                "expected_result": "成功登入"
-            }
-        ]
+    @pytest.fixture(autouse=True)
+    def wire_conversion_mocks(self, patch_main, wired_mocks):
+        """重置共用的 mock 並接到 main 模組的相依類別"""
+        for mock in wired_mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        
+        main_mocks = patch_main('setup_logger', 'ConfigManager',
+                                'TestRailXMLParser', 'TestCaseDataCleaner',
+                                'LarkDataFormatter', 'SimpleLarkClient')
+        main_mocks['setup_logger'].return_value = wired_mocks['logger']
+        main_mocks['ConfigManager'].return_value = wired_mocks['config_manager']
+        main_mocks['TestRailXMLParser'].return_value = wired_mocks['parser']
+        main_mocks['TestCaseDataCleaner'].return_value = wired_mocks['cleaner']
+        main_mocks['LarkDataFormatter'].return_value = wired_mocks['formatter']
+        main_mocks['SimpleLarkClient'].return_value = wired_mocks['client']
     
-    @patch('main.setup_application_logging')
-    @patch('main.ConfigManager')
-    @patch('main.TestRailXMLParser')
-    @patch('main.TestCaseDataCleaner')
-    @patch('main.LarkDataFormatter')
-    @patch('main.SimpleLarkClient')
-    def test_successful_conversion_flow(self, mock_client_class, mock_formatter_class, 
-                                      mock_cleaner_class, mock_parser_class, 
-                                      mock_config_class, mock_setup_logging):
-        """測試成功的完整轉換流程"""
+    # 各失敗情境對應的 (mock 名稱, 方法名稱)
+    FAILURE_POINTS = {
+        'parser': ('parser', 'parse_xml_file'),
+        'client_batch': ('client', 'batch_create_records'),
+        'config_load': ('config_manager', 'load_config'),
+    }
+    
+    @pytest.mark.parametrize('failing_mock,failure,expected', [
+        pytest.param(None, None, True, id='success'),
+        pytest.param('parser', Exception("XML 解析失敗"), False, id='xml_fail'),
+        pytest.param('client_batch', (False, []), False, id='lark_fail'),
+        pytest.param('config_load', Exception("配置載入失敗"), False, id='config_fail'),
+    ])
+    def test_conversion_flow(self, wired_mocks, sample_xml_path, failing_mock, failure, expected):
+        """測試完整轉換流程與各步驟失敗時的處理"""
         # 設定 mocks
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
+        mock_logger = wired_mocks['logger']
         
-        mock_config_manager = Mock()
-        mock_config_manager.get_lark_config.return_value = self.mock_config["lark"]
-        mock_config_class.return_value = mock_config_manager
+        mock_config_manager = wired_mocks['config_manager']
+        mock_config_manager.get_lark_config.return_value = _LARK_CFG
         
-        mock_parser = Mock()
-        mock_parser.parse_xml_file.return_value = self.test_data
-        mock_parser_class.return_value = mock_parser
+        mock_parser = wired_mocks['parser']
+        mock_parser.parse_xml_file.return_value = _TEST_DATA
         
-        mock_cleaner = Mock()
-        mock_cleaner.clean_test_case_fields.return_value = self.test_data[0]
-        mock_cleaner_class.return_value = mock_cleaner
+        mock_cleaner = wired_mocks['cleaner']
+        mock_cleaner.clean_test_case_fields.return_value = _TEST_CASE
         
-        mock_formatter = Mock()
-        mock_formatter.batch_format_records.return_value = self.test_data
-        mock_formatter_class.return_value = mock_formatter
+        mock_formatter = wired_mocks['formatter']
+        mock_formatter.batch_format_records.return_value = _TEST_DATA
         
-        mock_client = Mock()
+        mock_client = wired_mocks['client']
         mock_client.set_table_info.return_value = True
         mock_client.batch_create_records.return_value = (True, ["record_id_1"])
-        mock_client_class.return_value = mock_client
         
-        # 執行轉換流程
-        with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as temp_file:
-            temp_file.write(b'<test>content</test>')
-            xml_path = temp_file.name
-        
-        try:
-            result = main_conversion_flow(
-                xml_file_path=xml_path,
-                wiki_token="docABC123",
-                table_id="tblXYZ789",
-                config_path="test_config.yaml"
-            )
-            
-            # 驗證結果
-            assert result is True
-            
-            # 驗證各模組被正確調用
-            mock_parser.parse_xml_file.assert_called_once_with(xml_path)
-            mock_cleaner.clean_test_case_fields.assert_called()
-            mock_formatter.batch_format_records.assert_called()
-            mock_client.set_table_info.assert_called_once_with("docABC123", "tblXYZ789")
-            mock_client.batch_create_records.assert_called_once()
-            
-        finally:
-            os.unlink(xml_path)
-    
-    @patch('main.setup_application_logging')
-    @patch('main.ConfigManager')
-    @patch('main.TestRailXMLParser')
-    def test_xml_parsing_failure(self, mock_parser_class, mock_config_class, mock_setup_logging):
-        """測試 XML 解析失敗的處理"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_config_manager = Mock()
-        mock_config_manager.get_lark_config.return_value = self.mock_config["lark"]
-        mock_config_class.return_value = mock_config_manager
-        
-        mock_parser = Mock()
-        mock_parser.parse_xml_file.side_effect = Exception("XML 解析失敗")
-        mock_parser_class.return_value = mock_parser
+        # 設定失敗點：例外以 side_effect 拋出，其他值作為回傳值
+        if failing_mock:
+            mock_name, method_name = self.FAILURE_POINTS[failing_mock]
+            method = getattr(wired_mocks[mock_name], method_name)
+            if isinstance(failure, Exception):
+                method.side_effect = failure
+            else:
+                method.return_value = failure
         
         # 執行轉換流程
+        xml_path = sample_xml_path
         result = main_conversion_flow(
-            xml_file_path="/nonexistent/file.xml",
+            xml_file_path=xml_path,
             wiki_token="docABC123",
-            table_id="tblXYZ789"
+            table_id="tblXYZ789",
+            config_path="test_config.yaml"
         )
         
         # 驗證結果
-        assert result is False
-        mock_logger.error.assert_called()
-    
-    @patch('main.setup_application_logging')
-    @patch('main.ConfigManager')
-    @patch('main.TestRailXMLParser')
-    @patch('main.TestCaseDataCleaner')
-    @patch('main.LarkDataFormatter')
-    @patch('main.SimpleLarkClient')
-    def test_lark_api_failure(self, mock_client_class, mock_formatter_class, 
-                            mock_cleaner_class, mock_parser_class, 
-                            mock_config_class, mock_setup_logging):
-        """測試 Lark API 呼叫失敗的處理"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_config_manager = Mock()
-        mock_config_manager.get_lark_config.return_value = self.mock_config["lark"]
-        mock_config_class.return_value = mock_config_manager
-        
-        mock_parser = Mock()
-        mock_parser.parse_xml_file.return_value = self.test_data
-        mock_parser_class.return_value = mock_parser
+        assert result is expected
         
-        mock_cleaner = Mock()
-        mock_cleaner.clean_test_case_fields.return_value = self.test_data[0]
-        mock_cleaner_class.return_value = mock_cleaner
-        
-        mock_formatter = Mock()
-        mock_formatter.batch_format_records.return_value = self.test_data
-        mock_formatter_class.return_value = mock_formatter
-        
-        mock_client = Mock()
-        mock_client.set_table_info.return_value = True
-        mock_client.batch_create_records.return_value = (False, [])
-        mock_client_class.return_value = mock_client
-        
-        # 執行轉換流程
-        with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as temp_file:
-            temp_file.write(b'<test>content</test>')
-            xml_path = temp_file.name
-        
-        try:
-            result = main_conversion_flow(
-                xml_file_path=xml_path,
-                wiki_token="docABC123",
-                table_id="tblXYZ789"
-            )
-            
-            # 驗證結果
-            assert result is False
+        if expected:
+            # 驗證各模組被正確調用
+            mock_parser.parse_xml_file.assert_called_once_with(xml_path)
+            mock_cleaner.clean_test_case_fields.assert_called()
+            mock_formatter.batch_format_records.assert_called()
+            mock_client.set_table_info.assert_called_once_with("docABC123", "tblXYZ789")
+            mock_client.batch_create_records.assert_called_once_with(ANY)
+        else:
             mock_logger.error.assert_called()
-            
-        finally:
-            os.unlink(xml_path)
-    
-    @patch('main.setup_application_logging')
-    @patch('main.ConfigManager')
-    def test_config_loading_failure(self, mock_config_class, mock_setup_logging):
-        """測試配置載入失敗的處理"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_config_manager = Mock()
-        mock_config_manager.load_config.side_effect = Exception("配置載入失敗")
-        mock_config_class.return_value = mock_config_manager
-        
-        # 執行轉換流程
-        result = main_conversion_flow(
-            xml_file_path="/test/file.xml",
-            wiki_token="docABC123",
-            table_id="tblXYZ789",
-            config_path="invalid_config.yaml"
-        )
-        
-        # 驗證結果
-        assert result is False
-        mock_logger.error.assert_called()
 
 
 class TestHandleConversionRequest:
     """轉換請求處理測試"""
     
-    @patch('main.InteractiveCLI')
-    @patch('main.main_conversion_flow')
-    def test_successful_conversion_request(self, mock_conversion_flow, mock_cli_class):
+    def test_successful_conversion_request(self, patch_main, lark_cli_mock):
         """測試成功的轉換請求處理"""
-        mock_cli = Mock()
-        mock_cli.get_file_path_input.return_value = "/test/file.xml"
-        mock_cli.get_lark_config_input.return_value = {
-            "wiki_token": "docABC123",
-            "table_id": "tblXYZ789"
-        }
-        mock_cli_class.return_value = mock_cli
+        main_mocks = patch_main('main_conversion_flow')
+        mock_cli = lark_cli_mock
         
-        mock_conversion_flow.return_value = True
+        main_mocks['main_conversion_flow'].return_value = True
         
         # 執行轉換請求處理
         result = handle_conversion_request()
@@ -241,18 +231,15 @@ class TestHandleConversionRequest:
         assert result is True
         mock_cli.get_file_path_input.assert_called_once()
         mock_cli.get_lark_config_input.assert_called_once()
-        mock_conversion_flow.assert_called_once()
+        main_mocks['main_conversion_flow'].assert_called_once()
         mock_cli.show_results.assert_called_once()
     
-    @patch('main.InteractiveCLI')
-    @patch('main.main_conversion_flow')
-    def test_conversion_request_with_user_cancel(self, mock_conversion_flow, mock_cli_class):
+    def test_conversion_request_with_user_cancel(self, patch_main, lark_cli_mock):
         """測試用戶取消轉換請求的處理"""
-        from cli.interface import ValidationError
+        main_mocks = patch_main('main_conversion_flow')
         
-        mock_cli = Mock()
+        mock_cli = lark_cli_mock
         mock_cli.get_file_path_input.side_effect = ValidationError("用戶取消操作")
-        mock_cli_class.return_value = mock_cli
         
         # 執行轉換請求處理
         result = handle_conversion_request()
@@ -260,56 +247,39 @@ class TestHandleConversionRequest:
         # 驗證結果
         assert result is False
         mock_cli.get_file_path_input.assert_called_once()
-        mock_conversion_flow.assert_not_called()
+        main_mocks['main_conversion_flow'].assert_not_called()
     
-    @patch('main.InteractiveCLI')
-    @patch('main.main_conversion_flow')
-    def test_conversion_request_with_processing_error(self, mock_conversion_flow, mock_cli_class):
+    def test_conversion_request_with_processing_error(self, patch_main, lark_cli_mock):
         """測試轉換處理過程中發生錯誤"""
-        mock_cli = Mock()
-        mock_cli.get_file_path_input.return_value = "/test/file.xml"
-        mock_cli.get_lark_config_input.return_value = {
-            "wiki_token": "docABC123",
-            "table_id": "tblXYZ789"
-        }
-        mock_cli_class.return_value = mock_cli
+        main_mocks = patch_main('main_conversion_flow')
+        mock_cli = lark_cli_mock
         
-        mock_conversion_flow.side_effect = Exception("處理過程中發生錯誤")
+        main_mocks['main_conversion_flow'].side_effect = Exception("處理過程中發生錯誤")
         
         # 執行轉換請求處理
         result = handle_conversion_request()
         
         # 驗證結果
         assert result is False
-        mock_cli.show_results.assert_called_with(0, 1)  # 0成功，1錯誤
+        assert mock_cli.show_results.call_args == ((0, 1),)  # 0成功，1錯誤
 
 
 class TestHandleTestConnection:
     """連接測試處理測試"""
     
-    @patch('main.InteractiveCLI')
-    @patch('main.ConfigManager')
-    @patch('main.SimpleLarkClient')
-    def test_successful_connection_test(self, mock_client_class, mock_config_class, mock_cli_class):
+    def test_successful_connection_test(self, patch_main, lark_cli_mock):
         """測試成功的連接測試"""
-        mock_cli = Mock()
-        mock_cli.get_lark_config_input.return_value = {
-            "wiki_token": "docABC123",
-            "table_id": "tblXYZ789"
-        }
-        mock_cli_class.return_value = mock_cli
+        main_mocks = patch_main('ConfigManager', 'SimpleLarkClient')
+        mock_cli = lark_cli_mock
         
         mock_config_manager = Mock()
-        mock_config_manager.get_lark_config.return_value = {
-            "app_id": "test_app_id",
-            "app_secret": "test_app_secret"
-        }
-        mock_config_class.return_value = mock_config_manager
+        mock_config_manager.get_lark_config.return_value = _LARK_CFG
+        main_mocks['ConfigManager'].return_value = mock_config_manager
         
         mock_client = Mock()
         mock_client.set_table_info.return_value = True
         mock_client.test_connection.return_value = True
-        mock_client_class.return_value = mock_client
+        main_mocks['SimpleLarkClient'].return_value = mock_client
         
         # 執行連接測試
         result = handle_test_connection()
@@ -319,283 +289,192 @@ class TestHandleTestConnection:
         mock_cli.get_lark_config_input.assert_called_once()
         mock_client.set_table_info.assert_called_once_with("docABC123", "tblXYZ789")
         mock_client.test_connection.assert_called_once()
-        mock_cli.show_results.assert_called_with(1, 0)  # 1成功，0錯誤
+        assert mock_cli.show_results.call_args == ((1, 0),)  # 1成功，0錯誤
     
-    @patch('main.InteractiveCLI')
-    @patch('main.ConfigManager')
-    @patch('main.SimpleLarkClient')
-    def test_failed_connection_test(self, mock_client_class, mock_config_class, mock_cli_class):
+    def test_failed_connection_test(self, patch_main, lark_cli_mock):
         """測試失敗的連接測試"""
-        mock_cli = Mock()
-        mock_cli.get_lark_config_input.return_value = {
-            "wiki_token": "docABC123",
-            "table_id": "tblXYZ789"
-        }
-        mock_cli_class.return_value = mock_cli
+        main_mocks = patch_main('ConfigManager', 'SimpleLarkClient')
+        mock_cli = lark_cli_mock
         
         mock_config_manager = Mock()
-        mock_config_manager.get_lark_config.return_value = {
-            "app_id": "test_app_id",
-            "app_secret": "test_app_secret"
-        }
-        mock_config_class.return_value = mock_config_manager
+        mock_config_manager.get_lark_config.return_value = _LARK_CFG
+        main_mocks['ConfigManager'].return_value = mock_config_manager
         
         mock_client = Mock()
         mock_client.set_table_info.return_value = True
         mock_client.test_connection.return_value = False
-        mock_client_class.return_value = mock_client
+        main_mocks['SimpleLarkClient'].return_value = mock_client
         
         # 執行連接測試
         result = handle_test_connection()
         
         # 驗證結果
         assert result is False
-        mock_cli.show_results.assert_called_with(0, 1)  # 0成功，1錯誤
+        assert mock_cli.show_results.call_args == ((0, 1),)  # 0成功，1錯誤
 
 
 class TestParseCommandLineArgs:
     """命令列參數解析測試"""
     
-    def test_parse_no_arguments(self):
-        """測試無參數的情況"""
-        args = parse_command_line_args([])
-        
-        assert args.xml_file is None
-        assert args.wiki_token is None
-        assert args.table_id is None
-        assert args.config is None
-        assert args.mode == "interactive"
-    
-    def test_parse_conversion_arguments(self):
-        """測試轉換模式的參數"""
-        test_args = [
-            "--xml-file", "/path/to/test.xml",
-            "--wiki-token", "docABC123",
-            "--table-id", "tblXYZ789",
-            "--config", "/path/to/config.yaml"
-        ]
-        
-        args = parse_command_line_args(test_args)
-        
-        assert args.xml_file == "/path/to/test.xml"
-        assert args.wiki_token == "docABC123"
-        assert args.table_id == "tblXYZ789"
-        assert args.config == "/path/to/config.yaml"
-        assert args.mode == "convert"
-    
-    def test_parse_test_mode_arguments(self):
-        """測試連接測試模式的參數"""
-        test_args = [
-            "--mode", "test",
-            "--wiki-token", "docABC123",
-            "--table-id", "tblXYZ789"
-        ]
-        
-        args = parse_command_line_args(test_args)
-        
-        assert args.wiki_token == "docABC123"
-        assert args.table_id == "tblXYZ789"
-        assert args.mode == "test"
+    @pytest.mark.parametrize('argv,expected', [
+        pytest.param((), {
+            "xml_file": None,
+            "wiki_token": None,
+            "table_id": None,
+            "config": None,
+            "mode": "interactive",
+        }, id='no_arguments'),
+        pytest.param(_CONVERSION_ARGS, {
+            "xml_file": "/path/to/test.xml",
+            "wiki_token": "docABC123",
+            "table_id": "tblXYZ789",
+            "config": "/path/to/config.yaml",
+            "mode": "convert",
+        }, id='conversion_arguments'),
+        pytest.param(_TEST_MODE_ARGS, {
+            "wiki_token": "docABC123",
+            "table_id": "tblXYZ789",
+            "mode": "test",
+        }, id='test_mode_arguments'),
+        pytest.param(("--mode", "interactive"), {
+            "mode": "interactive",
+        }, id='interactive_mode'),
+    ])
+    def test_parse_args(self, argv, expected):
+        """測試各種命令列參數組合的解析結果"""
+        args = parse_command_line_args(argv)
+        
+        for name, value in expected.items():
+            assert getattr(args, name) == value, name
     
-    def test_parse_interactive_mode(self):
-        """測試互動模式參數"""
-        test_args = ["--mode", "interactive"]
-        
-        args = parse_command_line_args(test_args)
-        
-        assert args.mode == "interactive"
+    def test_parser_is_built_once(self):
+        """測試解析器只建立一次，且各次解析結果互不影響"""
+        first = parse_command_line_args(["--wiki-token", "docABC123"])
+        second = parse_command_line_args([])
+        
+        assert _build_parser() is _build_parser()
+        assert first.mode == "test"
+        assert second.mode == "interactive"
+        assert second.wiki_token is None
 
 
 class TestSetupApplicationLogging:
     """應用程式日誌設定測試"""
     
-    @patch('main.ConfigManager')
-    @patch('main.setup_logger')
-    def test_setup_logging_with_config(self, mock_setup_logger, mock_config_class):
-        """測試使用配置檔案設定日誌"""
-        mock_config_manager = Mock()
-        mock_config_class.return_value = mock_config_manager
-        
-        mock_logger = Mock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # 執行日誌設定
-        result = setup_application_logging("test_config.yaml")
-        
-        # 驗證結果
-        assert result == mock_logger
-        mock_config_manager.load_config.assert_called_once_with("test_config.yaml")
-        mock_setup_logger.assert_called_once_with("main", config_path="test_config.yaml")
-    
-    @patch('main.ConfigManager')
-    @patch('main.setup_logger')
-    def test_setup_logging_without_config(self, mock_setup_logger, mock_config_class):
-        """測試不使用配置檔案設定日誌"""
-        mock_logger = Mock()
-        mock_setup_logger.return_value = mock_logger
+    # 未指定配置檔案時改載入預設的 config/config.yaml
+    @pytest.mark.parametrize('cfg_path,load_fail,expected_config_path', [
+        pytest.param("test_config.yaml", False, "test_config.yaml", id='with_config'),
+        pytest.param(None, False, "config/config.yaml", id='without_config'),
+        pytest.param("invalid_config.yaml", True, None, id='config_error'),
+    ])
+    def test_setup_logging(self, patch_main, shared_logger, cfg_path, load_fail, expected_config_path):
+        """測試有無配置檔案及配置載入錯誤時的日誌設定"""
+        main_mocks = patch_main('ConfigManager', 'setup_logger')
+        mock_config_manager = main_mocks['ConfigManager'].return_value
+        if load_fail:
+            mock_config_manager.load_config.side_effect = Exception("配置載入失敗")
+        main_mocks['setup_logger'].return_value = shared_logger
         
         # 執行日誌設定
-        result = setup_application_logging()
+        result = setup_application_logging(cfg_path)
         
         # 驗證結果
-        assert result == mock_logger
-        mock_config_class.assert_not_called()
-        mock_setup_logger.assert_called_once_with("main", config_path=None)
-    
-    @patch('main.ConfigManager')
-    @patch('main.setup_logger')
-    def test_setup_logging_with_config_error(self, mock_setup_logger, mock_config_class):
-        """測試配置載入錯誤時的日誌設定"""
-        mock_config_manager = Mock()
-        mock_config_manager.load_config.side_effect = Exception("配置載入失敗")
-        mock_config_class.return_value = mock_config_manager
-        
-        mock_logger = Mock()
-        mock_setup_logger.return_value = mock_logger
-        
-        # 執行日誌設定
-        result = setup_application_logging("invalid_config.yaml")
-        
-        # 驗證結果
-        assert result == mock_logger
-        mock_setup_logger.assert_called_once_with("main", config_path=None)
+        assert result == shared_logger
+        mock_config_manager.load_config.assert_called_once_with(cfg_path or "config/config.yaml")
+        main_mocks['setup_logger'].assert_called_once_with("main", config_path=expected_config_path)
 
 
 class TestMainFunction:
     """主函數測試"""
     
-    @patch('main.handle_conversion_request')
-    @patch('main.InteractiveCLI')
-    @patch('main.setup_application_logging')
-    def test_main_interactive_mode_convert(self, mock_setup_logging, mock_cli_class, mock_handle_conversion):
-        """測試互動模式的轉換選擇"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_cli = Mock()
-        mock_cli.show_main_menu.return_value = "convert"
-        mock_cli_class.return_value = mock_cli
-        
-        mock_handle_conversion.return_value = True
+    @pytest.mark.parametrize('choice,handler', [
+        pytest.param('convert', 'handle_conversion_request', id='convert'),
+        pytest.param('test', 'handle_test_connection', id='test'),
+        pytest.param('quit', None, id='quit'),
+    ])
+    def test_main_interactive_dispatch(self, patch_main, cli_factory, monkeypatch, shared_logger,
+                                       choice, handler):
+        """測試互動模式依選單選擇分派到對應的處理函數"""
+        main_mocks = patch_main('setup_application_logging',
+                                'handle_conversion_request', 'handle_test_connection')
+        main_mocks['setup_application_logging'].return_value = shared_logger
+        
+        # 選擇功能後再選擇退出，讓互動迴圈結束
+        choices = [choice] if choice == 'quit' else [choice, 'quit']
+        mock_cli = cli_factory(*choices)
         
         # 執行主函數
-        with patch('sys.argv', ['main.py']):
-            result = main()
+        monkeypatch.setattr(sys, 'argv', ['main.py'])
+        result = main()
         
         # 驗證結果
         assert result == 0
-        mock_cli.show_main_menu.assert_called_once()
-        mock_handle_conversion.assert_called_once()
+        assert mock_cli.show_main_menu.call_count == len(choices)
+        for name in ('handle_conversion_request', 'handle_test_connection'):
+            if name == handler:
+                main_mocks[name].assert_called_once()
+            else:
+                main_mocks[name].assert_not_called()
     
-    @patch('main.handle_test_connection')
-    @patch('main.InteractiveCLI')
-    @patch('main.setup_application_logging')
-    def test_main_interactive_mode_test(self, mock_setup_logging, mock_cli_class, mock_handle_test):
-        """測試互動模式的連接測試選擇"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_cli = Mock()
-        mock_cli.show_main_menu.return_value = "test"
-        mock_cli_class.return_value = mock_cli
-        
-        mock_handle_test.return_value = True
-        
-        # 執行主函數
-        with patch('sys.argv', ['main.py']):
-            result = main()
-        
-        # 驗證結果
-        assert result == 0
-        mock_cli.show_main_menu.assert_called_once()
-        mock_handle_test.assert_called_once()
-    
-    @patch('main.InteractiveCLI')
-    @patch('main.setup_application_logging')
-    def test_main_interactive_mode_quit(self, mock_setup_logging, mock_cli_class):
-        """測試互動模式的退出選擇"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_cli = Mock()
-        mock_cli.show_main_menu.return_value = "quit"
-        mock_cli_class.return_value = mock_cli
-        
-        # 執行主函數
-        with patch('sys.argv', ['main.py']):
-            result = main()
-        
-        # 驗證結果
-        assert result == 0
-        mock_cli.show_main_menu.assert_called_once()
-    
-    @patch('main.main_conversion_flow')
-    @patch('main.setup_application_logging')
-    def test_main_convert_mode(self, mock_setup_logging, mock_conversion_flow):
+    def test_main_convert_mode(self, patch_main, monkeypatch, shared_logger):
         """測試命令列轉換模式"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
+        main_mocks = patch_main('setup_application_logging', 'validate_file_path',
+                                'main_conversion_flow')
+        mock_logger = shared_logger
+        main_mocks['setup_application_logging'].return_value = mock_logger
         
-        mock_conversion_flow.return_value = True
-        
-        test_args = [
-            'main.py',
-            '--xml-file', '/test/file.xml',
-            '--wiki-token', 'docABC123',
-            '--table-id', 'tblXYZ789'
-        ]
+        # 命令列指定的 XML 檔案不存在於磁碟，以 mock 視為有效路徑
+        main_mocks['validate_file_path'].return_value = True
+        main_mocks['main_conversion_flow'].return_value = True
         
         # 執行主函數
-        with patch('sys.argv', test_args):
-            result = main()
+        monkeypatch.setattr(sys, 'argv', ['main.py', *_MAIN_CONVERT_ARGS])
+        result = main()
         
         # 驗證結果
         assert result == 0
-        mock_conversion_flow.assert_called_once_with(
+        main_mocks['validate_file_path'].assert_called_once_with(
+            '/test/file.xml', allowed_extensions=['.xml']
+        )
+        main_mocks['main_conversion_flow'].assert_called_once_with(
             xml_file_path='/test/file.xml',
             wiki_token='docABC123',
             table_id='tblXYZ789',
             config_path=None
         )
     
-    @patch('main.handle_test_connection')
-    @patch('main.setup_application_logging')
-    def test_main_test_mode(self, mock_setup_logging, mock_handle_test):
+    def test_main_test_mode(self, patch_main, monkeypatch, shared_logger):
         """測試命令列連接測試模式"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
-        
-        mock_handle_test.return_value = True
+        main_mocks = patch_main('setup_application_logging', 'handle_test_connection')
+        mock_logger = shared_logger
+        main_mocks['setup_application_logging'].return_value = mock_logger
         
-        test_args = [
-            'main.py',
-            '--mode', 'test',
-            '--wiki-token', 'docABC123',
-            '--table-id', 'tblXYZ789'
-        ]
+        main_mocks['handle_test_connection'].return_value = True
         
         # 執行主函數
-        with patch('sys.argv', test_args):
-            result = main()
+        monkeypatch.setattr(sys, 'argv', ['main.py', *_TEST_MODE_ARGS])
+        result = main()
         
         # 驗證結果
         assert result == 0
-        mock_handle_test.assert_called_once()
+        main_mocks['handle_test_connection'].assert_called_once()
     
-    @patch('main.setup_application_logging')
-    def test_main_with_exception(self, mock_setup_logging):
+    def test_main_with_exception(self, patch_main, monkeypatch):
         """測試主函數異常處理"""
-        mock_logger = Mock()
-        mock_setup_logging.return_value = mock_logger
+        # 參數解析失敗時主日誌尚未設定，main() 改以 logging.getLogger("main") 記錄錯誤
+        main_mocks = patch_main('setup_application_logging', 'parse_command_line_args', 'logging')
+        mock_logger = main_mocks['logging'].getLogger.return_value
         
         # 模擬異常
-        with patch('main.parse_command_line_args', side_effect=Exception("測試異常")):
-            with patch('sys.argv', ['main.py']):
-                result = main()
+        main_mocks['parse_command_line_args'].side_effect = Exception("測試異常")
+        monkeypatch.setattr(sys, 'argv', ['main.py'])
+        result = main()
         
         # 驗證結果
         assert result == 1
-        mock_logger.error.assert_called()
+        main_mocks['setup_application_logging'].assert_not_called()
+        main_mocks['logging'].getLogger.assert_called_once_with("main")
+        mock_logger.error.assert_called_once_with("主程式執行失敗: 測試異常")
 
 
 if __name__ == "__main__":
@@ -10,15 +10,15 @@
 """
 
 import pytest
-import sys
 import os
-import tempfile
+import re
+import timeit
+from collections import namedtuple
 from pathlib import Path
-from unittest.mock import Mock, patch
-
-# 加入 src 目錄到 Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from types import MappingProxyType
+from unittest.mock import Mock
 
+from utils import validators
 from utils.validators import (
     validate_file_path,
     validate_test_case_number,
@@ -34,68 +34,117 @@ from utils.validators import (
 )
 
 
+SampleFiles = namedtuple('SampleFiles', ['plain', 'xml', 'txt'])
+
+
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """整個測試階段共用的唯讀樣本檔案：1KB 無副檔名檔案、.xml 與 .txt 檔案"""
+    base = tmp_path_factory.mktemp("validators")
+    plain = base / "sample_1kb"
+    plain.write_bytes(b"a" * 1024)
+    xml = base / "sample.xml"
+    xml.write_bytes(b"<test/>")
+    txt = base / "sample.txt"
+    txt.write_bytes(b"test content")
+    return SampleFiles(str(plain), str(xml), str(txt))
+
+
+# 各驗證函數共用的空值輸入：None、空字串、只有空白
+_EMPTYISH = (None, "", "   ")
+
+_INVALID_PRIORITIES = (
+    *_EMPTYISH,
+    "Critical",    # 不在標準列表中
+    "Normal",      # 不在標準列表中
+    "Urgent",      # 不在標準列表中
+    "123",        # 數字
+    "High-Priority",  # 包含特殊字符
+)
+_INVALID_EMAILS = (
+    *_EMPTYISH,
+    "invalid-email",
+    "@example.com",
+    "test@",
+    "test@.com",
+    "test..test@example.com",
+)
+_INVALID_URLS = (
+    *_EMPTYISH,
+    "not-a-url",
+    "ftp://example.com",  # 不支援的協議
+    "http://",
+    "https://",
+)
+
+# 必要欄位驗證共用的完整測試案例與必要欄位，各測試由此衍生變化
+_BASE_CASE = MappingProxyType({
+    "test_case_number": "TCG-001.002.003",
+    "title": "測試標題",
+    "priority": "High",
+    "precondition": "前置條件",
+    "steps": "測試步驟",
+    "expected_result": "預期結果",
+})
+_REQUIRED_FIELDS = ("test_case_number", "title", "priority", "steps", "expected_result")
+
+
+# 批次驗證共用的規則
+_BATCH_RULES = MappingProxyType({
+    "name": ("required", "string"),
+    "email": ("required", "email"),
+    "age": ("required", "integer", "min:0"),
+})
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """模組共用的 FieldValidator，僅供不會新增規則的唯讀測試使用"""
+    return FieldValidator()
+
+
 class TestValidateFilePath:
     """檔案路徑驗證測試"""
     
-    def test_validate_existing_file(self):
+    def test_validate_existing_file(self, sample_files):
         """測試驗證存在的檔案"""
-        # 創建臨時檔案
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
-            temp_file.write(b"test content")
-        
-        try:
-            # 驗證存在的檔案
-            assert validate_file_path(temp_path) is True
-        finally:
-            # 清理臨時檔案
-            os.unlink(temp_path)
+        assert validate_file_path(sample_files.plain) is True
     
     def test_validate_nonexistent_file(self):
         """測試驗證不存在的檔案"""
         nonexistent_path = "/path/to/nonexistent/file.txt"
         assert validate_file_path(nonexistent_path) is False
     
-    def test_validate_directory_as_file(self):
+    def test_validate_directory_as_file(self, tmp_path):
         """測試將目錄當作檔案驗證"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # 目錄不應被視為有效檔案
-            assert validate_file_path(temp_dir) is False
+        # 目錄不應被視為有效檔案
+        assert validate_file_path(str(tmp_path)) is False
     
-    def test_validate_file_with_extension_filter(self):
+    def test_validate_file_with_extension_filter(self, sample_files):
         """測試帶副檔名過濾的檔案驗證"""
-        # 創建不同副檔名的檔案
-        with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as xml_file:
-            xml_path = xml_file.name
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as txt_file:
-            txt_path = txt_file.name
-        
-        try:
-            # 測試允許的副檔名
-            assert validate_file_path(xml_path, allowed_extensions=['.xml']) is True
-            assert validate_file_path(txt_path, allowed_extensions=['.xml']) is False
-            
-            # 測試多個允許的副檔名
-            assert validate_file_path(xml_path, allowed_extensions=['.xml', '.txt']) is True
-            assert validate_file_path(txt_path, allowed_extensions=['.xml', '.txt']) is True
-        finally:
-            os.unlink(xml_path)
-            os.unlink(txt_path)
-    
-    def test_validate_file_size_limit(self):
+        xml_path, txt_path = sample_files.xml, sample_files.txt
+        
+        # 測試允許的副檔名
+        assert validate_file_path(xml_path, allowed_extensions=['.xml']) is True
+        assert validate_file_path(txt_path, allowed_extensions=['.xml']) is False
+        
+        # 測試多個允許的副檔名
+        assert validate_file_path(xml_path, allowed_extensions=['.xml', '.txt']) is True
+        assert validate_file_path(txt_path, allowed_extensions=['.xml', '.txt']) is True
+    
+    def test_validate_file_size_limit(self, sample_files):
         """測試檔案大小限制驗證"""
-        # 創建大小已知的檔案
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            content = b"a" * 1024  # 1KB
-            temp_file.write(content)
-            temp_path = temp_file.name
-        
-        try:
-            # 測試大小限制
-            assert validate_file_path(temp_path, max_size_mb=1) is True  # 1MB 限制
-            assert validate_file_path(temp_path, max_size_mb=0.0001) is False  # 0.0001MB 限制 (約100字節)
-        finally:
-            os.unlink(temp_path)
+        # 共用檔案大小為 1KB
+        assert validate_file_path(sample_files.plain, max_size_mb=1) is True  # 1MB 限制
+        assert validate_file_path(sample_files.plain, max_size_mb=0.0001) is False  # 0.0001MB 限制 (約100字節)
+    
+    def test_validate_file_path_stats_once(self, sample_files, monkeypatch):
+        """測試存在性、檔案類型與大小檢查共用同一次 os.stat"""
+        stat_mock = Mock(wraps=os.stat)
+        monkeypatch.setattr(validators.os, "stat", stat_mock)
+        
+        assert validate_file_path(sample_files.xml, allowed_extensions=['.xml'], max_size_mb=1) is True
+        stat_mock.assert_called_once()
     
     def test_validate_empty_or_none_path(self):
         """測試空路徑或 None 值"""
@@ -103,55 +152,42 @@ class TestValidateFilePath:
         assert validate_file_path(None) is False
         assert validate_file_path("   ") is False  # 空白字串
     
-    def test_validate_file_permissions(self):
+    def test_validate_file_permissions(self, sample_files, monkeypatch):
         """測試檔案權限驗證"""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = temp_file.name
-            temp_file.write(b"test content")
+        # 測試可讀檔案
+        assert validate_file_path(sample_files.plain, check_readable=True) is True
         
-        try:
-            # 測試可讀檔案
-            assert validate_file_path(temp_path, check_readable=True) is True
-            
-            # 模擬權限錯誤（在某些環境下可能無法測試）
-            with patch('os.access', return_value=False):
-                assert validate_file_path(temp_path, check_readable=True) is False
-        finally:
-            os.unlink(temp_path)
+        # 以 monkeypatch 取代 os.access 模擬權限錯誤
+        monkeypatch.setattr(validators.os, "access", lambda *args: False)
+        assert validate_file_path(sample_files.plain, check_readable=True) is False
 
 
 class TestValidateTestCaseNumber:
     """測試案例編號驗證測試"""
     
-    def test_validate_standard_format(self):
+    @pytest.mark.parametrize("number", [
+        "TCG-001.002.003",
+        "TCG-123.456.789",
+        "TCG-999.999.999",
+        "TCG-001.001.001",
+    ])
+    def test_validate_standard_format(self, number):
         """測試標準格式驗證"""
-        # 有效的測試案例編號
-        valid_numbers = [
-            "TCG-001.002.003",
-            "TCG-123.456.789",
-            "TCG-999.999.999",
-            "TCG-001.001.001"
-        ]
-        
-        for number in valid_numbers:
-            assert validate_test_case_number(number) is True, f"應該通過: {number}"
-    
-    def test_validate_invalid_format(self):
+        assert validate_test_case_number(number) is True
+    
+    @pytest.mark.parametrize("number", [
+        "TCG001.002.003",    # 缺少 hyphen
+        "TC-001.002.003",    # 錯誤前綴
+        "TCG-1.2.3",         # 數字太短
+        "TCG-001.002",       # 缺少第三段
+        "TCG-001.002.003.004",  # 多了一段
+        "TCG-abc.def.ghi",   # 非數字
+        "TCG-001.002.003.extra",  # 額外內容
+        *(pytest.param(value, id=repr(value)) for value in _EMPTYISH),
+    ])
+    def test_validate_invalid_format(self, number):
         """測試無效格式"""
-        invalid_numbers = [
-            "TCG001.002.003",    # 缺少 hyphen
-            "TC-001.002.003",    # 錯誤前綴
-            "TCG-1.2.3",         # 數字太短
-            "TCG-001.002",       # 缺少第三段
-            "TCG-001.002.003.004",  # 多了一段
-            "TCG-abc.def.ghi",   # 非數字
-            "",                  # 空字串
-            None,               # None 值
-            "TCG-001.002.003.extra"  # 額外內容
-        ]
-        
-        for number in invalid_numbers:
-            assert validate_test_case_number(number) is False, f"應該失敗: {number}"
+        assert validate_test_case_number(number) is False
     
     def test_validate_with_custom_pattern(self):
         """測試自訂模式驗證"""
@@ -170,6 +206,14 @@ class TestValidateTestCaseNumber:
         # 原始標準格式在自訂模式下應該失敗
         assert validate_test_case_number("TCG-001.002.003", pattern=custom_pattern) is False
     
+    def test_validate_with_compiled_pattern(self):
+        """測試傳入已編譯的自訂模式"""
+        compiled_pattern = re.compile(r"TEST-\d{2}\.\d{2}\.\d{2}")
+        
+        assert validate_test_case_number("TEST-12.34.56", pattern=compiled_pattern) is True
+        assert validate_test_case_number("  TEST-00.00.00  ", pattern=compiled_pattern) is True
+        assert validate_test_case_number("TCG-001.002.003", pattern=compiled_pattern) is False
+    
     def test_validate_case_sensitivity(self):
         """測試大小寫敏感性"""
         # 測試小寫
@@ -195,38 +239,27 @@ class TestValidateTestCaseNumber:
 class TestValidatePriorityValue:
     """優先級值驗證測試"""
     
-    def test_validate_standard_priorities(self):
+    @pytest.mark.parametrize("priority", ["High", "Medium", "Low"])
+    def test_validate_standard_priorities(self, priority):
         """測試標準優先級值"""
-        valid_priorities = ["High", "Medium", "Low"]
-        
-        for priority in valid_priorities:
-            assert validate_priority_value(priority) is True, f"應該通過: {priority}"
-    
-    def test_validate_case_insensitive(self):
+        assert validate_priority_value(priority) is True
+    
+    @pytest.mark.parametrize("base", ["high", "medium", "low"])
+    @pytest.mark.parametrize("case_fn", [
+        pytest.param(str.lower, id="lower"),
+        pytest.param(str.upper, id="upper"),
+        pytest.param(str.title, id="title"),
+        pytest.param(lambda s: "".join(c.upper() if i % 2 == 0 else c for i, c in enumerate(s)),
+                     id="alternating"),
+    ])
+    def test_validate_case_insensitive(self, case_fn, base):
         """測試大小寫不敏感"""
-        case_variations = [
-            "high", "HIGH", "High", "HiGh",
-            "medium", "MEDIUM", "Medium", "MeDiUm",
-            "low", "LOW", "Low", "LoW"
-        ]
-        
-        for priority in case_variations:
-            assert validate_priority_value(priority) is True, f"應該通過: {priority}"
+        assert validate_priority_value(case_fn(base)) is True
     
-    def test_validate_invalid_priorities(self):
+    @pytest.mark.parametrize("priority", _INVALID_PRIORITIES, ids=repr)
+    def test_validate_invalid_priorities(self, priority):
         """測試無效優先級值"""
-        invalid_priorities = [
-            "Critical",    # 不在標準列表中
-            "Normal",      # 不在標準列表中
-            "Urgent",      # 不在標準列表中
-            "",           # 空字串
-            None,         # None 值
-            "123",        # 數字
-            "High-Priority"  # 包含特殊字符
-        ]
-        
-        for priority in invalid_priorities:
-            assert validate_priority_value(priority) is False, f"應該失敗: {priority}"
+        assert validate_priority_value(priority) is False
     
     def test_validate_with_custom_values(self):
         """測試自訂優先級值"""
@@ -254,144 +287,101 @@ class TestValidateRequiredFields:
     
     def test_validate_complete_data(self):
         """測試完整資料驗證"""
-        complete_data = {
-            "test_case_number": "TCG-001.002.003",
-            "title": "測試標題",
-            "priority": "High",
-            "precondition": "前置條件",
-            "steps": "測試步驟",
-            "expected_result": "預期結果"
-        }
-        
-        required_fields = ["test_case_number", "title", "priority", "steps", "expected_result"]
-        
-        assert validate_required_fields(complete_data, required_fields) is True
+        assert validate_required_fields(dict(_BASE_CASE), list(_REQUIRED_FIELDS)) is True
     
     def test_validate_missing_fields(self):
         """測試缺失欄位"""
-        incomplete_data = {
-            "test_case_number": "TCG-001.002.003",
-            "title": "測試標題",
-            # 缺少 priority
-            "steps": "測試步驟",
-            "expected_result": "預期結果"
-        }
+        # 缺少 priority
+        incomplete_data = {k: v for k, v in _BASE_CASE.items() if k != "priority"}
         
-        required_fields = ["test_case_number", "title", "priority", "steps", "expected_result"]
-        
-        assert validate_required_fields(incomplete_data, required_fields) is False
+        assert validate_required_fields(incomplete_data, list(_REQUIRED_FIELDS)) is False
     
     def test_validate_empty_values(self):
         """測試空值處理"""
         data_with_empty = {
-            "test_case_number": "TCG-001.002.003",
+            **_BASE_CASE,
             "title": "",  # 空字串
-            "priority": "High",
             "steps": None,  # None 值
             "expected_result": "   "  # 只有空白
         }
         
-        required_fields = ["test_case_number", "title", "priority", "steps", "expected_result"]
-        
         # 預設情況下，空值應該導致驗證失敗
-        assert validate_required_fields(data_with_empty, required_fields) is False
+        assert validate_required_fields(data_with_empty, list(_REQUIRED_FIELDS)) is False
         
         # 允許空值時應該通過
-        assert validate_required_fields(data_with_empty, required_fields, allow_empty=True) is True
+        assert validate_required_fields(data_with_empty, list(_REQUIRED_FIELDS), allow_empty=True) is True
     
     def test_validate_extra_fields(self):
         """測試額外欄位處理"""
-        data_with_extra = {
-            "test_case_number": "TCG-001.002.003",
-            "title": "測試標題",
-            "priority": "High",
-            "steps": "測試步驟",
-            "expected_result": "預期結果",
-            "extra_field": "額外資料"  # 額外欄位
-        }
-        
-        required_fields = ["test_case_number", "title", "priority", "steps", "expected_result"]
+        data_with_extra = {**_BASE_CASE, "extra_field": "額外資料"}  # 額外欄位
         
         # 額外欄位不應影響驗證結果
-        assert validate_required_fields(data_with_extra, required_fields) is True
+        assert validate_required_fields(data_with_extra, list(_REQUIRED_FIELDS)) is True
 
 
 class TestValidateEmailFormat:
     """電子郵件格式驗證測試"""
     
-    def test_validate_valid_emails(self):
+    @pytest.mark.parametrize("email", [
+        "test@example.com",
+        "user.name@domain.co.uk",
+        "test123@test-domain.org",
+        "user+tag@example.com",
+        "test_user@subdomain.example.com",
+    ])
+    def test_validate_valid_emails(self, email):
         """測試有效的電子郵件地址"""
-        valid_emails = [
-            "test@example.com",
-            "user.name@domain.co.uk",
-            "test123@test-domain.org",
-            "user+tag@example.com",
-            "test_user@subdomain.example.com"
-        ]
-        
-        for email in valid_emails:
-            assert validate_email_format(email) is True, f"應該通過: {email}"
+        assert validate_email_format(email) is True
     
-    def test_validate_invalid_emails(self):
+    @pytest.mark.parametrize("email", _INVALID_EMAILS, ids=repr)
+    def test_validate_invalid_emails(self, email):
         """測試無效的電子郵件地址"""
-        invalid_emails = [
-            "invalid-email",
-            "@example.com",
-            "test@",
-            "test@.com",
-            "test..test@example.com",
-            "",
-            None
-        ]
+        assert validate_email_format(email) is False
+    
+    def test_validate_email_short_circuit(self, monkeypatch):
+        """測試缺少 @ 的字串不進入正則比對"""
+        mock_pattern = Mock(wraps=validators._EMAIL_PATTERN)
+        monkeypatch.setattr(validators, '_EMAIL_PATTERN', mock_pattern)
         
-        for email in invalid_emails:
-            assert validate_email_format(email) is False, f"應該失敗: {email}"
+        assert validate_email_format("invalid-email") is False
+        mock_pattern.match.assert_not_called()
+        
+        assert validate_email_format("test@example.com") is True
+        mock_pattern.match.assert_called_once_with("test@example.com")
 
 
 class TestValidateUrlFormat:
     """URL 格式驗證測試"""
     
-    def test_validate_valid_urls(self):
+    @pytest.mark.parametrize("url", [
+        "http://example.com",
+        "https://www.example.com",
+        "https://subdomain.example.com/path",
+        "http://example.com:8080/path?query=value",
+        "https://example.com/path#anchor",
+    ])
+    def test_validate_valid_urls(self, url):
         """測試有效的 URL"""
-        valid_urls = [
-            "http://example.com",
-            "https://www.example.com",
-            "https://subdomain.example.com/path",
-            "http://example.com:8080/path?query=value",
-            "https://example.com/path#anchor"
-        ]
-        
-        for url in valid_urls:
-            assert validate_url_format(url) is True, f"應該通過: {url}"
+        assert validate_url_format(url) is True
     
-    def test_validate_invalid_urls(self):
+    @pytest.mark.parametrize("url", _INVALID_URLS, ids=repr)
+    def test_validate_invalid_urls(self, url):
         """測試無效的 URL"""
-        invalid_urls = [
-            "not-a-url",
-            "ftp://example.com",  # 不支援的協議
-            "http://",
-            "https://",
-            "",
-            None
-        ]
-        
-        for url in invalid_urls:
-            assert validate_url_format(url) is False, f"應該失敗: {url}"
+        assert validate_url_format(url) is False
 
 
 class TestFieldValidator:
     """FieldValidator 類別測試"""
     
-    def test_field_validator_initialization(self):
+    def test_field_validator_initialization(self, validator):
         """測試 FieldValidator 初始化"""
-        validator = FieldValidator()
-        
         assert hasattr(validator, 'add_rule')
         assert hasattr(validator, 'validate')
         assert hasattr(validator, 'validate_batch')
     
     def test_add_custom_rule(self):
         """測試添加自訂驗證規則"""
+        # 會新增規則，使用獨立實例避免影響共用的 validator
         validator = FieldValidator()
         
         # 添加自訂規則
@@ -404,10 +394,8 @@ class TestFieldValidator:
         assert validator.validate("test field", ["min_length_5"]) is True
         assert validator.validate("abc", ["min_length_5"]) is False
     
-    def test_validate_with_multiple_rules(self):
+    def test_validate_with_multiple_rules(self, validator):
         """測試多重規則驗證"""
-        validator = FieldValidator()
-        
         # 使用多個內建規則
         rules = ["required", "string", "min_length:3"]
         
@@ -416,81 +404,48 @@ class TestFieldValidator:
         assert validator.validate(123, rules) is False  # 不滿足 string
         assert validator.validate("ab", rules) is False  # 不滿足 min_length:3
     
-    def test_validate_batch(self):
-        """測試批次驗證"""
-        validator = FieldValidator()
-        
-        data = {
-            "name": "測試名稱",
-            "email": "test@example.com",
-            "age": 25
-        }
-        
-        rules = {
-            "name": ["required", "string"],
-            "email": ["required", "email"],
-            "age": ["required", "integer", "min:0"]
-        }
-        
-        result = validator.validate_batch(data, rules)
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-    
-    def test_validate_batch_with_errors(self):
-        """測試批次驗證錯誤處理"""
-        validator = FieldValidator()
-        
-        data = {
-            "name": "",  # 空名稱
-            "email": "invalid-email",  # 無效電子郵件
-            "age": -5  # 負數年齡
-        }
-        
-        rules = {
-            "name": ["required", "string"],
-            "email": ["required", "email"],
-            "age": ["required", "integer", "min:0"]
-        }
-        
-        result = validator.validate_batch(data, rules)
-        assert result.is_valid is False
-        assert len(result.errors) > 0
-        assert "name" in result.errors
-        assert "email" in result.errors
-        assert "age" in result.errors
+    @pytest.mark.parametrize("data,expected_valid,expected_error_fields", [
+        pytest.param({"name": "測試名稱", "email": "test@example.com", "age": 25},
+                     True, set(), id="valid"),
+        pytest.param({"name": "", "email": "invalid-email", "age": -5},  # 空名稱、無效電子郵件、負數年齡
+                     False, {"name", "email", "age"}, id="errors"),
+    ])
+    def test_validate_batch(self, validator, data, expected_valid, expected_error_fields):
+        """測試批次驗證與錯誤處理"""
+        result = validator.validate_batch(data, _BATCH_RULES)
+        
+        assert result.is_valid is expected_valid
+        assert set(result.errors) == expected_error_fields
 
 
 class TestValidationError:
     """ValidationError 異常測試"""
     
-    def test_validation_error_creation(self):
-        """測試 ValidationError 創建"""
-        error_msg = "驗證失敗"
-        
-        with pytest.raises(ValidationError) as exc_info:
-            raise ValidationError(error_msg)
-        
-        assert str(exc_info.value) == error_msg
-    
-    def test_validation_error_with_field_info(self):
-        """測試帶欄位資訊的 ValidationError"""
+    def test_validation_error_attributes(self):
+        """測試 ValidationError 的訊息、欄位資訊與繼承關係"""
         error = ValidationError("驗證失敗", field="test_field", value="invalid_value")
         
-        assert error.field == "test_field"
-        assert error.value == "invalid_value"
-        assert "驗證失敗" in str(error)
+        assert (str(error), error.field, error.value, isinstance(error, Exception)) == \
+            ("驗證失敗", "test_field", "invalid_value", True)
     
-    def test_validation_error_inheritance(self):
-        """測試 ValidationError 繼承關係"""
-        error = ValidationError("測試錯誤")
-        assert isinstance(error, Exception)
+    def test_validation_error_raised(self):
+        """測試 ValidationError 可被當作一般 Exception 捕捉"""
+        with pytest.raises(Exception) as exc_info:
+            raise ValidationError("驗證失敗")
+        
+        assert exc_info.type is ValidationError
+        assert str(exc_info.value) == "驗證失敗"
 
 
 class TestGlobalValidatorFunctions:
     """全域驗證函數測試"""
     
-    def test_add_validation_rule(self):
+    def test_add_validation_rule(self, monkeypatch):
         """測試添加全域驗證規則"""
+        # 以規則表副本替換全域驗證器的規則，測試結束後自動還原，不影響其他測試
+        monkeypatch.setattr(validators._global_validator, 'rules',
+                            dict(validators._global_validator.rules))
+        
         # 添加自訂規則
         def custom_length_rule(value, min_len="5"):
             try:
@@ -521,13 +476,7 @@ class TestGlobalValidatorFunctions:
             "age": 25
         }
         
-        validation_rules = {
-            "name": ["required", "string"],
-            "email": ["required", "email"],
-            "age": ["required", "integer", "min:0"]
-        }
-        
-        result = validate_data(test_data, validation_rules)
+        result = validate_data(test_data, _BATCH_RULES)
         assert result.is_valid is True
         assert len(result.errors) == 0
         
@@ -538,7 +487,7 @@ class TestGlobalValidatorFunctions:
             "age": -5  # 負數
         }
         
-        result = validate_data(invalid_data, validation_rules)
+        result = validate_data(invalid_data, _BATCH_RULES)
         assert result.is_valid is False
         assert len(result.errors) > 0
 
@@ -567,25 +516,19 @@ class TestValidationResultHelpers:
 class TestFieldValidatorEdgeCases:
     """FieldValidator 邊界情況測試"""
     
-    def test_field_validator_unknown_rule(self):
+    def test_field_validator_unknown_rule(self, validator):
         """測試未知規則處理"""
-        validator = FieldValidator()
-        
         # 未知規則應該返回 False
         assert validator.validate("test", ["unknown_rule"]) is False
     
-    def test_field_validator_rule_with_invalid_parameter(self):
+    def test_field_validator_rule_with_invalid_parameter(self, validator):
         """測試帶無效參數的規則"""
-        validator = FieldValidator()
-        
         # 無效的數字參數
         assert validator.validate("test", ["min_length:invalid"]) is False
         assert validator.validate(25, ["min:invalid"]) is False
     
-    def test_field_validator_edge_values(self):
+    def test_field_validator_edge_values(self, validator):
         """測試邊界值"""
-        validator = FieldValidator()
-        
         # 測試空字串
         assert validator.validate("", ["string"]) is True
         assert validator.validate("", ["required"]) is False
@@ -600,5 +543,27 @@ class TestFieldValidatorEdgeCases:
         assert validator.validate(False, ["integer"]) is False
 
 
+
+@pytest.mark.perf
+class TestValidatorPerformance:
+    """正則驗證效能回歸測試（預設不執行，以 pytest -m perf 執行）"""
+    
+    ITERATIONS = 10000
+    
+    # 每項驗證執行 ITERATIONS 次允許的總秒數，預編譯模式下實際耗時遠低於此值
+    BUDGET_SECONDS = 0.5
+    
+    @pytest.mark.parametrize("func,value", [
+        pytest.param(validate_test_case_number, "TCG-001.002.003", id="test_case_number"),
+        pytest.param(validate_email_format, "user.name@domain.co.uk", id="email"),
+        pytest.param(validate_url_format, "https://subdomain.example.com/path", id="url"),
+        pytest.param(validate_priority_value, "  Medium  ", id="priority"),
+    ])
+    def test_validator_throughput(self, func, value):
+        """測試常用驗證在預設參數下的執行時間"""
+        elapsed = timeit.timeit(lambda: func(value), number=self.ITERATIONS)
+        assert elapsed < self.BUDGET_SECONDS
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -4,25 +4,71 @@ XML 解析器模組單元測試
 測試 TestRailXMLParser 類別的所有功能
 """
 
+import io
+import statistics
+import time
 import pytest
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 from typing import List, Dict, Any
 
 # 待實作的模組
 from parsers.xml_parser import TestRailXMLParser, TestRailParseError
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """模組共用的解析器實例（解析器不保存解析狀態，可安全重複使用）"""
+    return TestRailXMLParser()
+
+
+def _xml_stream(xml_content: str) -> io.BytesIO:
+    """將 XML 字串包成記憶體中的位元組串流，免去寫入暫存檔"""
+    return io.BytesIO(xml_content.encode("utf-8"))
+
+
+# 效能測試用的單一測試案例樣板與套件樣板
+_LARGE_CASE_TEMPLATE = '''
+                <case>
+                    <id>C{i:03d}</id>
+                    <title>TCG-{i:03d}.001.001 效能測試案例 {i}</title>
+                    <priority>Medium</priority>
+                    <custom>
+                        <preconds>效能測試前置條件 {i}</preconds>
+                        <steps>1. 執行效能測試步驟 {i}\\n2. 驗證結果</steps>
+                        <expected>預期效能測試結果 {i}</expected>
+                    </custom>
+                </case>'''
+_LARGE_SUITE_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<suite>
+    <sections>
+        <section>
+            <cases>{cases}
+            </cases>
+        </section>
+    </sections>
+</suite>'''
+
+# 包含 50 個測試案例的大型 XML，模組載入時產生一次
+_LARGE_XML = _LARGE_SUITE_TEMPLATE.format(
+    cases="".join(_LARGE_CASE_TEMPLATE.format(i=i) for i in range(50))
+)
+
+
+@pytest.fixture(scope="session")
+def large_xml_path(tmp_path_factory):
+    """整個測試階段只寫入一次的 50 個測試案例 XML 檔案"""
+    path = tmp_path_factory.mktemp("perf") / "large_test.xml"
+    path.write_text(_LARGE_XML, encoding="utf-8")
+    return path
+
+
 class TestTestRailXMLParser:
     """TestRailXMLParser 類別測試"""
 
-    def setup_method(self):
-        """每個測試方法前的設定"""
-        self.parser = TestRailXMLParser()
-
     @pytest.mark.xml_parser
-    def test_parse_xml_file_success(self, xml_test_helper, test_data_path):
+    def test_parse_xml_file_success(self, parser, xml_test_helper, test_data_path):
         """測試成功解析正常的 XML 檔案"""
         # 使用測試輔助工具載入範例 XML
         xml_file = test_data_path / "xml" / "sample_basic.xml"
@@ -30,7 +76,7 @@ class TestTestRailXMLParser:
         # 預期的測試案例數量
         expected_case_count = 2
         
-        result = self.parser.parse_xml_file(str(xml_file))
+        result = parser.parse_xml_file(str(xml_file))
         
         assert isinstance(result, list), "回傳值應為列表"
         assert len(result) == expected_case_count, f"應解析出 {expected_case_count} 個測試案例"
@@ -42,11 +88,21 @@ class TestTestRailXMLParser:
             assert key in first_case, f"測試案例缺少必要欄位: {key}"
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_with_real_testrail_data(self, test_data_path):
+    def test_parse_xml_file_keeps_multiline_steps(self, parser, test_data_path):
+        """測試多行步驟文字合併為單一字串且保留換行"""
+        xml_file = test_data_path / "xml" / "sample_basic.xml"
+        
+        result = parser.parse_xml_file(str(xml_file))
+        
+        assert result[0]["steps"] == "1. 開啟登入頁面\n2. 輸入有效的使用者名稱和密碼\n3. 點擊登入按鈕"
+        assert parser.get_parser_stats()["text_buffering"] is True
+
+    @pytest.mark.xml_parser
+    def test_parse_xml_file_with_real_testrail_data(self, parser, test_data_path):
         """測試解析真實的 TestRail XML 檔案"""
         xml_file = test_data_path / "xml" / "TP-3153 Associated Users Phase 2.xml"
         
-        result = self.parser.parse_xml_file(str(xml_file))
+        result = parser.parse_xml_file(str(xml_file))
         
         assert isinstance(result, list), "回傳值應為列表"
         assert len(result) > 0, "真實的 TestRail 檔案應包含測試案例"
@@ -63,32 +119,32 @@ class TestTestRailXMLParser:
             assert key in first_case, f"測試案例缺少必要欄位: {key}"
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_empty_path(self):
+    def test_parse_xml_file_empty_path(self, parser):
         """測試空檔案路徑的錯誤處理"""
         with pytest.raises(ValueError, match="檔案路徑不能為空"):
-            self.parser.parse_xml_file("")
+            parser.parse_xml_file("")
         
         with pytest.raises(ValueError, match="檔案路徑不能為空"):
-            self.parser.parse_xml_file(None)
+            parser.parse_xml_file(None)
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_not_found(self):
+    def test_parse_xml_file_not_found(self, parser):
         """測試檔案不存在的錯誤處理"""
         non_existent_file = "/path/to/non_existent.xml"
         
         with pytest.raises(FileNotFoundError):
-            self.parser.parse_xml_file(non_existent_file)
+            parser.parse_xml_file(non_existent_file)
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_malformed(self, test_data_path):
+    def test_parse_xml_file_malformed(self, parser, test_data_path):
         """測試格式錯誤的 XML 檔案處理"""
         malformed_file = test_data_path / "xml" / "malformed.xml"
         
         with pytest.raises(ET.ParseError):
-            self.parser.parse_xml_file(str(malformed_file))
+            parser.parse_xml_file(str(malformed_file))
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_non_xml_extension(self, file_test_helper):
+    def test_parse_xml_file_non_xml_extension(self, parser, file_test_helper):
         """測試非XML檔案格式的警告處理"""
         # 建立非XML格式的檔案
         xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -96,25 +152,25 @@ class TestTestRailXMLParser:
         non_xml_file = file_test_helper.create_temp_file(xml_content, "test.txt")
         
         # 應該會發出警告但仍會處理
-        result = self.parser.parse_xml_file(str(non_xml_file))
+        result = parser.parse_xml_file(str(non_xml_file))
         assert isinstance(result, list), "非XML檔名仍應正常處理"
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_empty(self, test_data_path):
+    def test_parse_xml_file_empty(self, parser, test_data_path):
         """測試空 XML 檔案處理"""
         empty_file = test_data_path / "xml" / "empty.xml"
         
-        result = self.parser.parse_xml_file(str(empty_file))
+        result = parser.parse_xml_file(str(empty_file))
         assert isinstance(result, list), "即使是空檔案也應回傳列表"
         assert len(result) == 0, "空檔案應回傳空列表"
 
     @pytest.mark.xml_parser
-    def test_extract_test_cases_from_xml_root(self, xml_test_helper):
+    def test_extract_test_cases_from_xml_root(self, parser, xml_test_helper):
         """測試從 XML 根元素提取測試案例"""
         # 載入測試 XML
         xml_root = xml_test_helper.load_xml_fixture("sample_basic.xml")
         
-        result = self.parser.extract_test_cases(xml_root)
+        result = parser.extract_test_cases(xml_root)
         
         assert isinstance(result, list), "回傳值應為列表"
         assert len(result) > 0, "應提取到測試案例"
@@ -128,14 +184,14 @@ class TestTestRailXMLParser:
                 assert field in case, f"案例缺少必要欄位: {field}"
 
     @pytest.mark.xml_parser
-    def test_extract_test_cases_with_none_root(self):
+    def test_extract_test_cases_with_none_root(self, parser):
         """測試XML根元素為None的情況"""
-        result = self.parser.extract_test_cases(None)
+        result = parser.extract_test_cases(None)
         assert isinstance(result, list), "None根元素應回傳空列表"
         assert len(result) == 0, "None根元素應回傳空列表"
 
     @pytest.mark.xml_parser
-    def test_extract_test_cases_with_missing_custom_element(self, data_test_helper):
+    def test_extract_test_cases_with_missing_custom_element(self, parser, data_test_helper):
         """測試提取缺少custom元素的測試案例"""
         # 建立缺少custom元素的測試案例
         case_elem = ET.Element("case")
@@ -151,7 +207,7 @@ class TestTestRailXMLParser:
         cases = ET.SubElement(section, "cases")
         cases.append(case_elem)
         
-        result = self.parser.extract_test_cases(suite_root)
+        result = parser.extract_test_cases(suite_root)
         
         # 應該能處理缺少custom元素的情況
         assert len(result) == 1, "應該提取到一個案例"
@@ -161,7 +217,7 @@ class TestTestRailXMLParser:
         assert case["expected"] == "", "缺少custom元素時expected應為空字串"
 
     @pytest.mark.xml_parser
-    def test_extract_test_cases_with_empty_title(self, data_test_helper):
+    def test_extract_test_cases_with_empty_title(self, parser, data_test_helper):
         """測試提取缺少標題的測試案例"""
         # 建立缺少標題的測試案例
         case_elem = ET.Element("case")
@@ -176,13 +232,13 @@ class TestTestRailXMLParser:
         cases = ET.SubElement(section, "cases")
         cases.append(case_elem)
         
-        result = self.parser.extract_test_cases(suite_root)
+        result = parser.extract_test_cases(suite_root)
         
         # 缺少標題的案例應被過濾掉
         assert len(result) == 0, "缺少標題的案例應被過濾掉"
 
     @pytest.mark.xml_parser
-    def test_extract_test_cases_with_missing_fields(self, data_test_helper):
+    def test_extract_test_cases_with_missing_fields(self, parser, data_test_helper):
         """測試提取缺少部分欄位的測試案例"""
         # 建立缺少某些欄位的測試 XML 元素
         incomplete_case = data_test_helper.create_sample_xml_case(
@@ -207,7 +263,7 @@ class TestTestRailXMLParser:
         cases = ET.SubElement(section, "cases")
         cases.append(incomplete_case)
         
-        result = self.parser.extract_test_cases(suite_root)
+        result = parser.extract_test_cases(suite_root)
         
         # 應該能處理缺失欄位的情況
         assert len(result) == 1, "應該提取到一個案例"
@@ -215,30 +271,30 @@ class TestTestRailXMLParser:
         assert case.get("expected", "") == "", "缺失的欄位應為空字串"
 
     @pytest.mark.xml_parser
-    def test_validate_xml_structure_valid(self, xml_test_helper):
+    def test_validate_xml_structure_valid(self, parser, xml_test_helper):
         """測試驗證有效的 XML 結構"""
         xml_root = xml_test_helper.load_xml_fixture("sample_basic.xml")
         
-        result = self.parser.validate_xml_structure(xml_root)
+        result = parser.validate_xml_structure(xml_root)
         assert result is True, "有效的 XML 結構應通過驗證"
 
     @pytest.mark.xml_parser
-    def test_validate_xml_structure_with_none_root(self):
+    def test_validate_xml_structure_with_none_root(self, parser):
         """測試驗證None根元素的情況"""
-        result = self.parser.validate_xml_structure(None)
+        result = parser.validate_xml_structure(None)
         assert result is False, "None根元素應驗證失敗"
 
     @pytest.mark.xml_parser
-    def test_validate_xml_structure_invalid(self):
+    def test_validate_xml_structure_invalid(self, parser):
         """測試驗證無效的 XML 結構"""
         # 建立無效的 XML 結構（缺少必要元素）
         invalid_root = ET.Element("invalid_root")
         
-        result = self.parser.validate_xml_structure(invalid_root)
+        result = parser.validate_xml_structure(invalid_root)
         assert result is False, "無效的 XML 結構應驗證失敗"
 
     @pytest.mark.xml_parser
-    def test_validate_xml_structure_non_suite_root(self):
+    def test_validate_xml_structure_non_suite_root(self, parser):
         """測試非suite根元素但包含case的XML結構"""
         # 建立非suite根元素但直接包含case的結構
         other_root = ET.Element("testrail")
@@ -246,11 +302,11 @@ class TestTestRailXMLParser:
         ET.SubElement(case_elem, "id").text = "C001"
         ET.SubElement(case_elem, "title").text = "測試案例"
         
-        result = self.parser.validate_xml_structure(other_root)
+        result = parser.validate_xml_structure(other_root)
         assert result is True, "包含case元素的非suite根元素應通過驗證"
 
     @pytest.mark.xml_parser
-    def test_validate_xml_structure_with_direct_cases(self):
+    def test_validate_xml_structure_with_direct_cases(self, parser):
         """測試直接在根元素下包含case的XML結構"""
         # 建立直接在根元素下包含case的結構（不通過sections）
         root_with_cases = ET.Element("root")
@@ -258,7 +314,7 @@ class TestTestRailXMLParser:
         ET.SubElement(case_elem, "id").text = "C001"
         ET.SubElement(case_elem, "title").text = "直接案例"
         
-        result = self.parser.validate_xml_structure(root_with_cases)
+        result = parser.validate_xml_structure(root_with_cases)
         assert result is True, "直接包含case的結構應通過驗證"
 
     @pytest.mark.xml_parser
@@ -287,29 +343,30 @@ class TestTestRailXMLParser:
         assert expected is not None and expected.text == "預期的測試結果"
 
     @pytest.mark.xml_parser
-    def test_get_element_text_with_none_parent(self):
+    def test_get_element_text_with_none_parent(self, parser):
         """測試_get_element_text方法處理None父元素的情況"""
-        result = self.parser._get_element_text(None, "test_tag", "default_value")
+        result = parser._get_element_text(None, "test_tag", "default_value")
         assert result == "default_value", "None父元素應回傳預設值"
 
     @pytest.mark.xml_parser
-    def test_get_element_text_with_missing_element(self):
+    def test_get_element_text_with_missing_element(self, parser):
         """測試_get_element_text方法處理缺失元素的情況"""
         parent = ET.Element("parent")
-        result = self.parser._get_element_text(parent, "missing_tag", "default_value")
+        result = parser._get_element_text(parent, "missing_tag", "default_value")
         assert result == "default_value", "缺失元素應回傳預設值"
 
     @pytest.mark.xml_parser
-    def test_get_parser_stats(self):
+    def test_get_parser_stats(self, parser):
         """測試取得解析器統計資訊"""
-        stats = self.parser.get_parser_stats()
+        stats = parser.get_parser_stats()
         assert isinstance(stats, dict), "統計資訊應為字典"
         assert "parser_type" in stats, "應包含解析器類型"
         assert "supported_formats" in stats, "應包含支援格式"
         assert "features" in stats, "應包含功能列表"
+        assert stats["xml_backend"] in ("_elementtree", "xml.etree.ElementTree"), "應標示 XML 解析後端"
 
     @pytest.mark.xml_parser  
-    def test_handle_special_characters_in_xml(self, file_test_helper):
+    def test_handle_special_characters_in_xml(self, parser):
         """測試處理 XML 中的特殊字元"""
         # 建立包含特殊字元的 XML 內容
         xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -332,10 +389,7 @@ class TestTestRailXMLParser:
     </sections>
 </suite>'''
         
-        # 建立臨時檔案
-        temp_file = file_test_helper.create_temp_file(xml_content, "special_chars.xml")
-        
-        result = self.parser.parse_xml_file(str(temp_file))
+        result = parser.parse_xml_stream(_xml_stream(xml_content))
         
         assert len(result) == 1, "應解析出一個測試案例"
         case = result[0]
@@ -347,59 +401,47 @@ class TestTestRailXMLParser:
         assert "<標籤>" in case["expected"], "標籤應被正確解析"
 
     @pytest.mark.xml_parser
-    def test_parse_large_xml_file_performance(self, file_test_helper):
+    def test_parse_large_xml_file_performance(self, parser, large_xml_path, monkeypatch):
         """測試大型 XML 檔案的解析效能"""
-        # 建立包含多個測試案例的大型 XML
-        cases_xml = ""
-        for i in range(50):  # 建立 50 個測試案例
-            cases_xml += f'''
-                <case>
-                    <id>C{i:03d}</id>
-                    <title>TCG-{i:03d}.001.001 效能測試案例 {i}</title>
-                    <priority>Medium</priority>
-                    <custom>
-                        <preconds>效能測試前置條件 {i}</preconds>
-                        <steps>1. 執行效能測試步驟 {i}\\n2. 驗證結果</steps>
-                        <expected>預期效能測試結果 {i}</expected>
-                    </custom>
-                </case>'''
-        
-        large_xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<suite>
-    <sections>
-        <section>
-            <cases>{cases_xml}
-            </cases>
-        </section>
-    </sections>
-</suite>'''
+        # 以呼叫次數作為確定性的檢查：每個 case 元素只提取一次，解析成本隨案例數線性成長
+        extract = Mock(wraps=parser._extract_single_test_case)
+        monkeypatch.setattr(parser, "_extract_single_test_case", extract)
         
-        temp_file = file_test_helper.create_temp_file(large_xml_content, "large_test.xml")
-        
-        import time
-        start_time = time.time()
-        result = self.parser.parse_xml_file(str(temp_file))
-        end_time = time.time()
+        durations = []
+        for _ in range(5):
+            start_ns = time.perf_counter_ns()
+            result = parser.parse_xml_file(str(large_xml_path))
+            durations.append(time.perf_counter_ns() - start_ns)
         
         assert len(result) == 50, "應解析出 50 個測試案例"
-        assert end_time - start_time < 5.0, "大型檔案解析應在 5 秒內完成"
+        assert extract.call_count == 5 * 50, "每個測試案例每次解析應只提取一次"
+        # 取中位數降低 CI 環境雜訊影響，僅作為嚴重退化的防線
+        assert statistics.median(durations) < 1_000_000_000, "大型檔案解析中位數應在 1 秒內"
 
     @pytest.mark.xml_parser
-    def test_error_handling_and_logging(self, caplog):
+    def test_parse_xml_file_interns_priority(self, parser, large_xml_path):
+        """測試相同的優先級值在所有測試案例間共用同一字串物件"""
+        result = parser.parse_xml_file(str(large_xml_path))
+        
+        priorities = {id(case["priority"]) for case in result}
+        assert len(priorities) == len({case["priority"] for case in result}), "相同優先級應共用同一字串物件"
+
+    @pytest.mark.xml_parser
+    def test_error_handling_and_logging(self, parser, caplog):
         """測試錯誤處理和日誌記錄"""
         import logging
         
         # 測試檔案不存在的情況
         with caplog.at_level(logging.ERROR):
             with pytest.raises(FileNotFoundError):
-                self.parser.parse_xml_file("non_existent.xml")
+                parser.parse_xml_file("non_existent.xml")
         
         # 檢查是否有適當的日誌記錄
         assert any("檔案不存在" in record.message or "不存在" in record.message 
                   for record in caplog.records if record.levelno >= logging.ERROR)
 
     @pytest.mark.xml_parser
-    def test_parse_xml_file_with_invalid_structure(self, file_test_helper):
+    def test_parse_xml_file_with_invalid_structure(self, parser):
         """測試XML結構驗證失敗的情況"""
         # 建立完全沒有case元素的XML，這會觸發驗證失敗
         invalid_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -407,31 +449,68 @@ class TestTestRailXMLParser:
     <no_cases_here/>
 </invalid>'''
         
-        temp_file = file_test_helper.create_temp_file(invalid_xml, "invalid_structure.xml")
+        with pytest.raises(ValueError, match="XML 檔案結構不符合 TestRail 格式"):
+            parser.parse_xml_stream(_xml_stream(invalid_xml))
+
+    @pytest.mark.xml_parser
+    def test_parse_xml_stream_rejects_case_root(self, parser):
+        """測試根元素本身為 case 時不視為測試案例"""
+        case_root_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<case>
+    <id>C001</id>
+    <title>TCG-001.001.001 根元素案例</title>
+</case>'''
         
         with pytest.raises(ValueError, match="XML 檔案結構不符合 TestRail 格式"):
-            self.parser.parse_xml_file(str(temp_file))
+            parser.parse_xml_stream(_xml_stream(case_root_xml))
 
     @pytest.mark.xml_parser
-    def test_extract_single_test_case_with_exception(self):
+    def test_parse_xml_stream_nested_cases_in_end_order(self, parser):
+        """測試巢狀 case 依結束順序輸出：內層案例排在外層之前"""
+        nested_case_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<suite>
+    <cases>
+        <case>
+            <id>C001</id>
+            <title>外層案例</title>
+            <custom>
+                <case>
+                    <id>C002</id>
+                    <title>內層案例</title>
+                </case>
+            </custom>
+        </case>
+        <case>
+            <id>C003</id>
+            <title>後續案例</title>
+        </case>
+    </cases>
+</suite>'''
+        
+        result = parser.parse_xml_stream(_xml_stream(nested_case_xml))
+        
+        assert [case["id"] for case in result] == ["C002", "C001", "C003"]
+
+    @pytest.mark.xml_parser
+    def test_extract_single_test_case_with_exception(self, parser):
         """測試_extract_single_test_case方法遇到異常的情況"""
         # 建立一個會導致異常的元素（缺少必要子元素）
         case_elem = ET.Element("case")
         # 故意不添加任何子元素，這會在提取時造成問題
         
-        result = self.parser._extract_single_test_case(case_elem)
+        result = parser._extract_single_test_case(case_elem)
         
         # 方法應該能處理異常並回傳None
         assert result is None, "遇到異常的案例應該回傳None"
 
     @pytest.mark.xml_parser
-    def test_extract_single_test_case_with_none(self):
+    def test_extract_single_test_case_with_none(self, parser):
         """測試_extract_single_test_case方法處理None元素的情況"""
-        result = self.parser._extract_single_test_case(None)
+        result = parser._extract_single_test_case(None)
         assert result is None, "None元素應該回傳None"
 
     @pytest.mark.xml_parser
-    def test_xml_namespace_handling(self, file_test_helper):
+    def test_xml_namespace_handling(self, parser):
         """測試處理帶有命名空間的 XML"""
         # 簡化為無命名空間的XML，因為目前的實作不支援命名空間
         xml_simple = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -454,9 +533,7 @@ class TestTestRailXMLParser:
     </sections>
 </suite>'''
         
-        temp_file = file_test_helper.create_temp_file(xml_simple, "namespace_test.xml")
-        
-        result = self.parser.parse_xml_file(str(temp_file))
+        result = parser.parse_xml_stream(_xml_stream(xml_simple))
         
         assert isinstance(result, list), "應該回傳列表"
         assert len(result) == 1, "應該有一個測試案例"
@@ -466,14 +543,8 @@ class TestTestRailXMLParser:
 class TestXMLParserEdgeCases:
     """XML 解析器邊界條件測試"""
 
-    def setup_method(self):
-        """每個測試方法前的設定"""
-        # 等實作完成後再引入
-        # self.parser = TestRailXMLParser()
-        pass
-
     @pytest.mark.xml_parser
-    def test_empty_test_case_elements(self, file_test_helper):
+    def test_empty_test_case_elements(self, parser):
         """測試空的測試案例元素"""
         # 改為非空標題但其他欄位為空的測試
         empty_case_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -496,9 +567,7 @@ class TestXMLParserEdgeCases:
     </sections>
 </suite>'''
         
-        temp_file = file_test_helper.create_temp_file(empty_case_xml, "empty_case.xml")
-        
-        result = self.parser.parse_xml_file(str(temp_file))
+        result = parser.parse_xml_stream(_xml_stream(empty_case_xml))
         
         # 有標題的案例應該被保留
         assert len(result) == 1, "有標題的案例應被保留"
@@ -508,7 +577,7 @@ class TestXMLParserEdgeCases:
         assert case["priority"] == "Medium", "空優先級應設為預設值"
 
     @pytest.mark.xml_parser
-    def test_deeply_nested_xml_structure(self, file_test_helper):
+    def test_deeply_nested_xml_structure(self, parser):
         """測試深層巢狀的 XML 結構"""
         nested_xml = '''<?xml version="1.0" encoding="UTF-8"?>
 <suite>
@@ -541,9 +610,7 @@ class TestXMLParserEdgeCases:
     </sections>
 </suite>'''
         
-        temp_file = file_test_helper.create_temp_file(nested_xml, "nested_test.xml")
-        
-        result = self.parser.parse_xml_file(str(temp_file))
+        result = parser.parse_xml_stream(_xml_stream(nested_xml))
         
         assert len(result) == 1, "應該能處理深層巢狀結構"
         case = result[0]